@@ -4,7 +4,7 @@ Clean and minimal configuration system.
 """
 
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from dynaconf import Dynaconf
 from src.utils.loguru_config import logger, get_logger
 from src.core.business.configuration import ConfigurationBusinessLogic
@@ -25,6 +25,9 @@ class ConfigManager:
         # 跟踪运行时修改的值
         self._pending_changes = {}
         
+        # Bumped on every set()/reload() so callers can memoize derived values
+        self.revision = 0
+        
         # Initialize core business logic
         self.core_config = ConfigurationBusinessLogic()
         self._setup_core_sections()
@@ -66,6 +69,21 @@ class ConfigManager:
             logger.error(f"Failed to get config key '{key}'")
             return default
     
+    def get_many(self, keys: Tuple[str, ...], defaults: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """Get several dot-notation values, resolving each parent section only once."""
+        sections: Dict[str, Any] = {}
+        values = []
+        for key, default in zip(keys, defaults, strict=True):
+            parent, _, leaf = key.rpartition(".")
+            if not parent:
+                values.append(self.get(key, default))
+                continue
+            if parent not in sections:
+                sections[parent] = self.get(parent)
+            section = sections[parent]
+            values.append(section.get(leaf, default) if section is not None else default)
+        return tuple(values)
+    
     def set(self, key: str, value: Any) -> bool:
         """Set configuration value with change tracking."""
         try:
@@ -74,6 +92,7 @@ class ConfigManager:
             
             # 跟踪变更以便保存
             self._pending_changes[key] = value
+            self.revision += 1
             
             logger.info(f"Set config key '{key}' = {value}")
             return True
@@ -85,6 +104,7 @@ class ConfigManager:
         """Reload configuration from files."""
         try:
             self.settings.reload()
+            self.revision += 1
             logger.info("Configuration reloaded")
             return True
         except Exception as e:
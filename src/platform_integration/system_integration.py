@@ -87,6 +87,10 @@ class SystemIntegrationService(QObject):
         """
         return self.window_service.get_active_window_info()
     
+    def get_window_info(self, hwnd: int) -> Optional[WindowInfo]:
+        """Get information about a specific window"""
+        return self.window_service.get_window_info(hwnd)
+    
     def focus_window(self, window_info: WindowInfo) -> bool:
         """Focus the specified window"""
         return self.window_service.focus_window(window_info)
@@ -131,6 +131,8 @@ class WindowContext:
     timestamp: float = field(default_factory=time.time)
     is_valid: bool = True
     validation_result: ContextValidationResult = ContextValidationResult.VALID
+    # SystemIntegrationService WindowInfo for window_info, converted once at capture
+    system_window_info: Any = field(default=None, repr=False, compare=False)
 
     def is_expired(self, max_age_seconds: float = 30.0) -> bool:
         """Check if context is expired based on timestamp"""
@@ -31,17 +31,24 @@ class WindowContextManager(QObject):
 
         logger.info("WindowContextManager initialized")
 
-    def capture_context(self) -> WindowContext | None:
+    def capture_context(self, hwnd: int | None = None) -> WindowContext | None:
         """
         Capture the current window context including active window and cursor position.
 
+        Args:
+            hwnd: Window to describe, read by the caller while it was in the
+                foreground; None uses the current foreground window
+
         Returns:
             WindowContext if successful, None if capture failed
         """
         # Performance monitoring removed during loguru migration
         try:
                 # Get active window information
-                window_info = self.system_service.get_active_window_info()
+                if hwnd is None:
+                    window_info = self.system_service.get_active_window_info()
+                else:
+                    window_info = self.system_service.get_window_info(hwnd)
                 if not window_info:
                     logger.error("Failed to get active window info")
                     return None
@@ -51,7 +58,11 @@ class WindowContextManager(QObject):
 
                 # Create window context
                 context = WindowContext(
-                    window_info=context_window_info, timestamp=time.time()
+                    window_info=context_window_info,
+                    timestamp=time.time(),
+                    system_window_info=self._convert_to_system_window_info(
+                        context_window_info
+                    ),
                 )
 
                 logger.info(f" Context captured for window: {window_info.title[:30]}...")
@@ -146,10 +157,7 @@ class WindowContextManager(QObject):
             True if restoration was successful, False otherwise
         """
         try:
-            # Convert our WindowInfo back to SystemIntegrationService WindowInfo
-            system_window_info = self._convert_to_system_window_info(
-                context.window_info
-            )
+            system_window_info = self._get_system_window_info(context)
 
             # Focus the original window
             focus_success = self.system_service.focus_window(system_window_info)
@@ -217,6 +225,25 @@ class WindowContextManager(QObject):
             is_enabled=True,  # Assume enabled if it's active
         )
 
+    def _get_system_window_info(self, context: WindowContext):
+        """
+        Get the SystemIntegrationService WindowInfo for a context.
+
+        Uses the copy converted at capture time, converting only for
+        contexts built elsewhere.
+
+        Args:
+            context: The WindowContext to convert
+
+        Returns:
+            SystemIntegrationService WindowInfo instance
+        """
+        if context.system_window_info is None:
+            context.system_window_info = self._convert_to_system_window_info(
+                context.window_info
+            )
+        return context.system_window_info
+
     def _convert_to_system_window_info(self, window_info: WindowInfo):
         """
         Convert our WindowInfo model to SystemIntegrationService WindowInfo.
@@ -79,6 +79,33 @@ class WindowService(QObject):
             if not hwnd:
                 return None
             
+            window_info = self.get_window_info(hwnd)
+            if window_info is None:
+                return None
+            
+            # Update current window tracking
+            if not self.current_window or self.current_window.hwnd != hwnd:
+                self.current_window = window_info
+                self.window_changed.emit(window_info)
+                logger.info(f"Active window changed: {window_info.title} ({window_info.process_name})")
+            
+            return window_info
+        
+        except Exception as e:
+            logger.error(f"Failed to get active window info: {e}")
+            return None
+    
+    def get_window_info(self, hwnd: int) -> Optional[WindowInfo]:
+        """
+        Get information about a specific window
+        
+        Args:
+            hwnd: Window handle
+            
+        Returns:
+            WindowInfo object with window details or None if failed
+        """
+        try:
             # Get window title
             title = win32gui.GetWindowText(hwnd)
             
@@ -105,19 +132,13 @@ class WindowService(QObject):
                 class_name=class_name,
                 process_id=process_id,
                 process_name=process_name,
-                is_active=True,
+                is_active=win32gui.GetForegroundWindow() == hwnd,
             )
             
-            # Update current window tracking
-            if not self.current_window or self.current_window.hwnd != hwnd:
-                self.current_window = window_info
-                self.window_changed.emit(window_info)
-                logger.info(f"Active window changed: {title} ({process_name})")
-            
             return window_info
         
         except Exception as e:
-            logger.error(f"Failed to get active window info: {e}")
+            logger.error(f"Failed to get window info: {e}")
             return None
     
     def focus_window(self, window_info: WindowInfo) -> bool:
@@ -27,6 +27,8 @@ class QtRenderer(QObject):
         self.theme = "dark"
         self.opacity = 0.9
         self.blur_radius = 0.0
+        # Rules for the widget's children, kept after the background rule
+        self.child_stylesheet = ""
 
         # Initialize Qt renderer
         self._initialize_qt_renderer()
@@ -108,7 +110,7 @@ class QtRenderer(QObject):
                 }}
             """
 
-            self.widget.setStyleSheet(style)
+            self.widget.setStyleSheet(style + self.child_stylesheet)
             logger.info(f"Applied Qt styling: RGBA({r}, {g}, {b}, {alpha})")
 
         except Exception as e:
@@ -3,6 +3,8 @@ Asynchronous Text Processor
 Handles non-blocking AI text processing operations
 """
 
+import heapq
+import threading
 import time
 from enum import Enum
 from typing import Optional, Dict, Any
@@ -52,12 +54,16 @@ class AsyncProcessor(QThread):
         self.ai_service_manager = ai_service_manager
         self.logger = get_logger(__name__)
         
-        # Request management
-        self._request_queue: list[ProcessingRequest] = []
+        # Request management: a min-heap of (-priority, timestamp, request_id, request),
+        # guarded by _queue_cond which also wakes the worker on submit/stop
+        self._request_queue: list[tuple] = []
+        self._queue_cond = threading.Condition()
         self._current_request: Optional[ProcessingRequest] = None
         self._request_counter = 0
         self._is_running = False
         self._stop_requested = False
+        # IDs of requests cancelled after the worker picked them up
+        self._cancelled_ids: set[int] = set()
         
         # Performance tracking
         self._processing_times: Dict[int, float] = {}
@@ -88,8 +94,12 @@ class AsyncProcessor(QThread):
             )
             
             # Add to priority queue
-            self._request_queue.append(request)
-            self._request_queue.sort()  # Sort by priority and timestamp
+            with self._queue_cond:
+                heapq.heappush(
+                    self._request_queue,
+                    (-priority.value, request.timestamp, request_id, request),
+                )
+                self._queue_cond.notify()
             
             if window_context:
                 logger.info(f"Request submitted: ID={request_id} with context: {window_context.get('window_title', 'Unknown')}")
@@ -110,14 +120,16 @@ class AsyncProcessor(QThread):
             
             while not self._stop_requested:
                 try:
-                    # Check for pending requests
-                    if self._request_queue:
+                    # Sleep until a request is submitted or stop is requested
+                    with self._queue_cond:
+                        while not self._request_queue and not self._stop_requested:
+                            self._queue_cond.wait()
+                        if self._stop_requested:
+                            break
                         # Get highest priority request
-                        request = self._request_queue.pop(0)
-                        self._process_request(request)
-                    else:
-                        # No requests, sleep briefly
-                        self.msleep(50)  # 50ms sleep
+                        request = heapq.heappop(self._request_queue)[3]
+                        self._current_request = request
+                    self._process_request(request)
                         
                 except Exception as e:
                     logger.error(f"Error in processing loop: {e}")
@@ -136,6 +148,9 @@ class AsyncProcessor(QThread):
             self._current_request = request
             start_time = time.time()
             
+            if self._consume_cancellation(request):
+                return
+            
             # Emit processing started signal
             self.processing_started.emit(request.request_id, request.agent_name)
             
@@ -149,6 +164,10 @@ class AsyncProcessor(QThread):
                     window_context=request.window_context
                 )
                 
+                # Drop results nobody is waiting for any more
+                if self._consume_cancellation(request):
+                    return
+                
                 if result and result.strip():
                     # Record processing time
                     processing_time = time.time() - start_time
@@ -179,12 +198,59 @@ class AsyncProcessor(QThread):
             logger.error(f"Request failed: ID={request.request_id}")
         finally:
             self._current_request = None
+            self._cancelled_ids.discard(request.request_id)
+    
+    def _consume_cancellation(self, request: ProcessingRequest) -> bool:
+        """Emit processing_cancelled if request was cancelled while in flight."""
+        if request.request_id not in self._cancelled_ids:
+            return False
+        
+        self._cancelled_ids.discard(request.request_id)
+        self.processing_cancelled.emit(request.request_id, request.agent_name)
+        logger.info(f"Request cancelled: ID={request.request_id}")
+        return True
+    
+    def cancel_request(self, request_id: int) -> bool:
+        """Cancel a pending or in-flight request
+        
+        Queued requests are dropped immediately. A request the worker is
+        already running is flagged; its result is discarded and
+        processing_cancelled is emitted instead of processing_completed.
+        """
+        try:
+            with self._queue_cond:
+                for i, entry in enumerate(self._request_queue):
+                    if entry[2] == request_id:
+                        request = entry[3]
+                        self._request_queue[i] = self._request_queue[-1]
+                        self._request_queue.pop()
+                        heapq.heapify(self._request_queue)
+                        break
+                else:
+                    request = None
+                    current = self._current_request
+                    if current is not None and current.request_id == request_id:
+                        self._cancelled_ids.add(request_id)
+                        return True
+            
+            if request is None:
+                return False
+            
+            self.processing_cancelled.emit(request.request_id, request.agent_name)
+            logger.info(f"Queued request cancelled: ID={request_id}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to cancel request {request_id}: {e}")
+            return False
     
     def stop_processing(self):
         """Stop the processing thread"""
         try:
             logger.info("Stopping AsyncProcessor...")
-            self._stop_requested = True
+            with self._queue_cond:
+                self._stop_requested = True
+                self._queue_cond.notify_all()
             
             # Cancel current request if any
             if self._current_request:
@@ -194,18 +260,24 @@ class AsyncProcessor(QThread):
                 )
             
             # Clear pending requests
-            cancelled_count = len(self._request_queue)
-            for request in self._request_queue:
+            pending = self._drain_queue()
+            cancelled_count = len(pending)
+            for request in pending:
                 self.processing_cancelled.emit(request.request_id, request.agent_name)
             
-            self._request_queue.clear()
-            
             if cancelled_count > 0:
                 logger.info(f"Cancelled {cancelled_count} pending requests")
             
         except Exception as e:
             logger.error(f"Error stopping AsyncProcessor: {e}")
     
+    def _drain_queue(self) -> list[ProcessingRequest]:
+        """Remove and return all pending requests in priority order"""
+        with self._queue_cond:
+            entries = sorted(self._request_queue)
+            self._request_queue.clear()
+        return [entry[3] for entry in entries]
+    
     def get_queue_size(self) -> int:
         """Get current queue size"""
         return len(self._request_queue)
@@ -237,13 +309,12 @@ class AsyncProcessor(QThread):
     def clear_queue(self):
         """Clear all pending requests"""
         try:
-            cancelled_count = len(self._request_queue)
+            pending = self._drain_queue()
+            cancelled_count = len(pending)
             
-            for request in self._request_queue:
+            for request in pending:
                 self.processing_cancelled.emit(request.request_id, request.agent_name)
             
-            self._request_queue.clear()
-            
             logger.info(f"Cleared {cancelled_count} pending requests")
             
         except Exception as e:
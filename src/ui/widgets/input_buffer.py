@@ -3,8 +3,9 @@ Input Buffer Module
 Handles non-blocking input text management and change detection
 """
 import contextlib
+import time
 
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import QMetaMethod, QObject, Signal, QTimer
 from PySide6.QtWidgets import QTextEdit
 
 from src.utils.loguru_config import logger, get_logger
@@ -15,6 +16,7 @@ class InputBuffer(QObject):
     
     # Signals
     text_changed = Signal(str)  # Emitted when text changes
+    content_changed = Signal(bool)  # Emitted when text changes: has non-whitespace content
     content_cleared = Signal()  # Emitted when content is cleared
     content_processed = Signal(str)  # Emitted when content is marked as processed
     
@@ -27,6 +29,11 @@ class InputBuffer(QObject):
         self._content = ""
         self._is_processed = False
         self._last_change_time = 0.0
+        # Widget edited since _content was last read; last text sent via text_changed
+        self._dirty = False
+        self._last_emitted = ""
+        # text_changed copies the whole text through Qt; only pay for it when connected
+        self._text_changed_method = QMetaMethod.fromSignal(self.text_changed)
         
         # Change detection
         self._change_timer = QTimer()
@@ -42,42 +49,55 @@ class InputBuffer(QObject):
     
     def _on_text_changed(self):
         """Handle text widget changes with debouncing"""
-        try:
-            import time
-            
-            # Get current text
-            current_text = self.text_widget.toPlainText() if self.text_widget else ""
-            
-            # Update internal state
-            self._content = current_text
-            self._is_processed = False
-            self._last_change_time = time.time()
-            
-            # Restart debounce timer
-            self._change_timer.start(self._debounce_ms)
-            
-        except Exception as e:
-            logger.error(f"Error handling text change: {e}")
+        # Runs per keystroke: only mark dirty, the text is read once the burst settles
+        self._dirty = True
+        self._is_processed = False
+        self._last_change_time = time.time()
+        
+        # Restart debounce timer
+        self._change_timer.start(self._debounce_ms)
+    
+    def _sync_content(self) -> str:
+        """Refresh _content from the widget if it was edited since the last read"""
+        if self._dirty:
+            self._dirty = False
+            self._content = self.text_widget.toPlainText() if self.text_widget else ""
+        return self._content
     
     def _on_change_timeout(self):
         """Handle debounced text change"""
         try:
+            content = self._sync_content()
+            
+            # Edits that cancel out within the debounce window are not a change
+            if content == self._last_emitted:
+                return
+            self._last_emitted = content
+            
             # Emit text changed signal after debounce
-            self.text_changed.emit(self._content)
+            self._emit_change(content)
             
-            logger.info(f"Text changed: {len(self._content)} chars")
+            logger.info(f"Text changed: {len(content)} chars")
             
         except Exception as e:
             logger.error(f"Error in change timeout: {e}")
     
+    def _emit_change(self, content: str):
+        """Notify listeners of new content; the text itself is pulled via get_content"""
+        self.content_changed.emit(bool(content) and not content.isspace())
+        if self.isSignalConnected(self._text_changed_method):
+            self.text_changed.emit(content)
+    
     def get_content(self) -> str:
         """Get current buffer content"""
-        return self._content
+        return self._sync_content()
     
     def set_content(self, text: str):
         """Set buffer content programmatically"""
         try:
             self._content = text
+            self._dirty = False
+            self._last_emitted = text
             self._is_processed = False
             
             # Update text widget if available
@@ -88,7 +108,7 @@ class InputBuffer(QObject):
                 self.text_widget.textChanged.connect(self._on_text_changed)
             
             # Emit change signal
-            self.text_changed.emit(text)
+            self._emit_change(text)
             
             logger.info(f"Content set programmatically: {len(text)} chars")
             
@@ -99,6 +119,9 @@ class InputBuffer(QObject):
         """Clear buffer content"""
         try:
             self._content = ""
+            self._dirty = False
+            self._last_emitted = ""
+            self._change_timer.stop()
             self._is_processed = False
             
             # Clear text widget if available
@@ -120,7 +143,7 @@ class InputBuffer(QObject):
         """Mark current content as processed"""
         try:
             self._is_processed = True
-            self.content_processed.emit(self._content)
+            self.content_processed.emit(self._sync_content())
             
             logger.info(f"Content marked as processed: {len(self._content)} chars")
             
@@ -133,15 +156,16 @@ class InputBuffer(QObject):
     
     def is_empty(self) -> bool:
         """Check if buffer is empty"""
-        return not self._content.strip()
+        return not self._sync_content().strip()
     
     def get_word_count(self) -> int:
         """Get word count of current content"""
-        return len(self._content.split()) if self._content else 0
+        content = self._sync_content()
+        return len(content.split()) if content else 0
     
     def get_char_count(self) -> int:
         """Get character count of current content"""
-        return len(self._content)
+        return len(self._sync_content())
     
     def set_debounce_time(self, ms: int):
         """Set debounce time in milliseconds"""
@@ -3,7 +3,7 @@ Simplified Window Positioning Module
 Uses Qt6 built-in APIs for cursor following, multi-monitor support, and screen geometry.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Optional
 
@@ -21,9 +21,9 @@ class PositionStrategy(Enum):
     EDGE_AVOID = "edge_avoid"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PositionConfig:
-    """Configuration for window positioning"""
+    """Configuration for window positioning (immutable, safe to share)"""
     cursor_offset: QPoint = QPoint(10, -10)
     boundary_margin: int = 20
     edge_threshold: int = 50
@@ -55,7 +55,7 @@ class WindowPositioning(QObject):
     screen_changed = Signal(QScreen)  # new screen
     
     def __init__(self, target_widget: QWidget, config: Optional[PositionConfig] = None):
-        super().__init__()
+        super().__init__(target_widget)
         self.logger = get_logger(__name__)
         self.target_widget = target_widget
         self.config = config or PositionConfig()
@@ -227,22 +227,22 @@ class WindowPositioning(QObject):
     
     def set_cursor_offset(self, offset: QPoint):
         """Set cursor offset for positioning."""
-        self.config.cursor_offset = offset
+        self.config = replace(self.config, cursor_offset=offset)
         logger.info(f"Cursor offset set to: ({offset.x()}, {offset.y()})")
     
     def set_boundary_margin(self, margin: int):
         """Set boundary margin in pixels."""
-        self.config.boundary_margin = max(0, margin)
+        self.config = replace(self.config, boundary_margin=max(0, margin))
         logger.info(f"Boundary margin set to: {self.config.boundary_margin}px")
     
     def set_edge_threshold(self, threshold: int):
         """Set edge avoidance threshold in pixels."""
-        self.config.edge_threshold = max(0, threshold)
+        self.config = replace(self.config, edge_threshold=max(0, threshold))
         logger.info(f"Edge threshold set to: {self.config.edge_threshold}px")
     
     def enable_multi_monitor(self, enabled: bool):
         """Enable or disable multi-monitor support."""
-        self.config.multi_monitor_enabled = enabled
+        self.config = replace(self.config, multi_monitor_enabled=enabled)
         logger.info(f"Multi-monitor support: {'enabled' if enabled else 'disabled'}")
     
     def get_screen_geometry(self) -> dict:
@@ -4,12 +4,18 @@ Handles intelligent processing triggers with debouncing and priority management
 """
 
 import time
+from types import MappingProxyType
 from typing import Dict, Any
 from PySide6.QtCore import QObject, Signal, QTimer
 
 from src.utils.loguru_config import logger, get_logger
 
 
+def _is_nonblank(text: str) -> bool:
+    """Check text has non-whitespace content without allocating a stripped copy"""
+    return bool(text) and not text.isspace()
+
+
 class TriggerManager(QObject):
     """Manages intelligent processing triggers with debouncing"""
     
@@ -32,8 +38,10 @@ class TriggerManager(QObject):
         # Current trigger state
         self._pending_text = ""
         self._pending_agent = ""
+        # (text, agent) of the last emitted trigger; the trailing edge skips repeats
+        self._last_triggered = ("", "")
         self._is_processing = False
-        self._last_trigger_time = 0.0
+        self._last_trigger_time = 0.0  # time.monotonic() stamp, not wall clock
         
         # Trigger statistics
         self._trigger_counts: Dict[str, int] = {
@@ -43,44 +51,52 @@ class TriggerManager(QObject):
             "manual": 0,
             "immediate": 0
         }
+        # Read-only live view handed out by get_trigger_statistics
+        self._trigger_counts_view = MappingProxyType(self._trigger_counts)
         
         logger.info(f" TriggerManager initialized with {debounce_ms}ms debounce")
     
     def on_text_changed(self, text: str, agent_name: str):
-        """Handle text change with debouncing"""
-        try:
-            if self._is_processing:
-                # Skip if already processing
-                logger.info("Processing in progress")
-                return
-            
-            # Skip if text is empty
-            if not text.strip():
-                logger.info("Empty text")
-                return
-            
-            self._pending_text = text
-            self._pending_agent = agent_name
-            
-            # Restart debounce timer
-            self._text_change_timer.start(self.debounce_ms)
-            
-            logger.info(f" Text change detected")
-            
-        except Exception as e:
-            logger.error(f" Error handling text change: {e}")
+        """Handle text change with leading + trailing edge debouncing"""
+        # Skip if text is empty
+        if not _is_nonblank(text):
+            logger.info("Empty text")
+            return
+        
+        self._pending_text = text
+        self._pending_agent = agent_name
+        
+        if self._is_processing:
+            # Kept pending; set_processing_state(False) re-arms the trailing edge
+            logger.info("Processing in progress")
+            return
+        
+        # Restart debounce timer
+        was_active = self._text_change_timer.isActive()
+        self._text_change_timer.start(self.debounce_ms)
+        
+        # Leading edge: fire immediately on the first change after a quiet period
+        elapsed_ms = (time.monotonic() - self._last_trigger_time) * 1000
+        if not was_active and elapsed_ms > self.debounce_ms:
+            # The trailing edge still fires if more changes arrive before it
+            self._trigger_processing("text_change", text, agent_name)
+        
+        logger.info(f" Text change detected")
     
     def _on_text_change_timeout(self):
         """Handle debounced text change"""
-        try:
-            if not self._pending_text.strip() or self._is_processing:
-                return
-            
-            # Trigger processing
-            self._trigger_processing("text_change", self._pending_text, self._pending_agent)
-            
-        except Exception as e:
-            logger.error(f" Error in text change timeout: {e}")
+        if not self._has_unprocessed_pending() or self._is_processing:
+            return
+        
+        # Trigger processing
+        self._trigger_processing("text_change", self._pending_text, self._pending_agent)
+    
+    def _has_unprocessed_pending(self) -> bool:
+        """Check the pending text differs from what was last sent for processing"""
+        return (
+            _is_nonblank(self._pending_text)
+            and (self._pending_text, self._pending_agent) != self._last_triggered
+        )
     
     def on_enter_key_pressed(self, text: str, agent_name: str):
         """Handle Enter key press - immediate trigger"""
@@ -88,7 +104,7 @@ class TriggerManager(QObject):
             # Cancel any pending text change triggers
             self._text_change_timer.stop()
             
-            if text.strip():
+            if _is_nonblank(text):
                 self._trigger_processing("enter_key", text, agent_name)
             
         except Exception as e:
@@ -100,7 +116,7 @@ class TriggerManager(QObject):
             # Cancel any pending triggers
             self._text_change_timer.stop()
             
-            if text.strip():
+            if _is_nonblank(text):
                 self._trigger_processing("agent_switch", text, agent_name)
             
         except Exception as e:
@@ -112,7 +128,7 @@ class TriggerManager(QObject):
             # Cancel any pending triggers
             self._text_change_timer.stop()
             
-            if text.strip():
+            if _is_nonblank(text):
                 self._trigger_processing("manual", text, agent_name)
             
         except Exception as e:
@@ -124,7 +140,7 @@ class TriggerManager(QObject):
             # Cancel any pending triggers
             self._text_change_timer.stop()
             
-            if text.strip():
+            if _is_nonblank(text):
                 self._trigger_processing("immediate", text, agent_name)
             
         except Exception as e:
@@ -132,41 +148,40 @@ class TriggerManager(QObject):
     
     def _trigger_processing(self, trigger_type: str, text: str, agent_name: str):
         """Internal method to trigger processing"""
-        try:
-            # Update statistics
-            self._trigger_counts[trigger_type] = self._trigger_counts.get(trigger_type, 0) + 1
-            self._last_trigger_time = time.time()
-            
-            # Emit processing signal
-            self.processing_triggered.emit(trigger_type, text, agent_name)
-            
-            logger.info(f" Processing triggered: {trigger_type}")
-            
-        except Exception as e:
-            logger.error(f" Error triggering processing: {e}")
+        # Update statistics
+        self._trigger_counts[trigger_type] = self._trigger_counts.get(trigger_type, 0) + 1
+        self._last_trigger_time = time.monotonic()
+        self._last_triggered = (text, agent_name)
+        
+        # Emit processing signal
+        self.processing_triggered.emit(trigger_type, text, agent_name)
+        
+        logger.info(f" Processing triggered: {trigger_type}")
     
     def set_processing_state(self, is_processing: bool):
         """Set processing state to prevent duplicate triggers"""
-        try:
-            self._is_processing = is_processing
-            
-            if is_processing:
-                # Cancel any pending triggers when processing starts
-                self._text_change_timer.stop()
-            
-            logger.info(f" Processing state: {'active' if is_processing else 'idle'}")
-            
-        except Exception as e:
-            logger.error(f" Error setting processing state: {e}")
+        self._is_processing = is_processing
+        
+        if is_processing:
+            # Hold pending triggers while processing; the pending text is kept
+            self._text_change_timer.stop()
+        elif self._has_unprocessed_pending():
+            # Edits made while processing get their trailing-edge trigger
+            self._text_change_timer.start(self.debounce_ms)
+        
+        logger.info(f" Processing state: {'active' if is_processing else 'idle'}")
     
     def cancel_pending_triggers(self):
         """Cancel all pending triggers"""
         try:
-            # Stop all timers
+            # Stop all timers and forget the pending text
+            was_active = self._text_change_timer.isActive()
             self._text_change_timer.stop()
+            self._pending_text = ""
+            self._last_triggered = ("", "")
             
             # Emit cancellation signal if there was a pending trigger
-            if self._text_change_timer.isActive():
+            if was_active:
                 self.trigger_cancelled.emit("text_change")
             
             logger.info(" All pending triggers cancelled")
@@ -176,20 +191,16 @@ class TriggerManager(QObject):
     
     def set_debounce_time(self, ms: int):
         """Set debounce time in milliseconds"""
-        try:
-            self.debounce_ms = max(100, min(ms, 5000))  # Clamp between 100ms and 5s
-            
-            logger.info(f" Debounce time set to: {self.debounce_ms}ms")
-            
-        except Exception as e:
-            logger.error(f" Error setting debounce time: {e}")
+        self.debounce_ms = max(100, min(ms, 5000))  # Clamp between 100ms and 5s
+        
+        logger.info(f" Debounce time set to: {self.debounce_ms}ms")
     
     def get_trigger_statistics(self) -> Dict[str, Any]:
         """Get trigger statistics"""
         return {
-            "trigger_counts": self._trigger_counts.copy(),
+            "trigger_counts": self._trigger_counts_view,
             "total_triggers": sum(self._trigger_counts.values()),
-            "last_trigger_time": self._last_trigger_time,
+            "last_trigger_time": self._last_trigger_time,  # monotonic seconds
             "debounce_ms": self.debounce_ms,
             "is_processing": self._is_processing,
             "has_pending_triggers": self._text_change_timer.isActive()
@@ -197,14 +208,12 @@ class TriggerManager(QObject):
     
     def reset_statistics(self):
         """Reset trigger statistics"""
-        try:
-            self._trigger_counts = {key: 0 for key in self._trigger_counts}
-            self._last_trigger_time = 0.0
-            
-            logger.info(" Trigger statistics reset")
-            
-        except Exception as e:
-            logger.error(f" Error resetting statistics: {e}")
+        # Reset in place so the read-only view stays bound to the live dict
+        for key in self._trigger_counts:
+            self._trigger_counts[key] = 0
+        self._last_trigger_time = 0.0
+        
+        logger.info(" Trigger statistics reset")
     
     def cleanup(self):
         """Clean up resources"""
@@ -1,9 +1,8 @@
 import asyncio
 import threading
+import weakref
 
 from PySide6.QtCore import (
-    Q_ARG,
-    QMetaObject,
     QObject,
     Qt,
     QTimer,
@@ -55,7 +54,9 @@ class AsyncTaskRunner(QObject):
             time.sleep(0.1)
 
         if self.loop and not self.loop.is_closed():
-            asyncio.run_coroutine_threadsafe(coro, self.loop)
+            # Fire-and-forget: schedule the task without allocating a
+            # concurrent Future that nobody waits on
+            self.loop.call_soon_threadsafe(self.loop.create_task, coro)
 
     def cleanup(self):
         """Clean up resources"""
@@ -71,6 +72,38 @@ class AsyncTaskRunner(QObject):
         self.thread = None
 
 
+class _HeartbeatTicker:
+    """Single heartbeat timer shared by all recording VoiceInputWidgets"""
+
+    INTERVAL_MS = 5000
+
+    _timer: QTimer | None = None
+    _subscribers: "weakref.WeakSet[VoiceInputWidget]" = weakref.WeakSet()
+
+    @classmethod
+    def subscribe(cls, widget: "VoiceInputWidget"):
+        """Add widget to heartbeat fan-out, starting the timer if idle"""
+        cls._subscribers.add(widget)
+        if cls._timer is None:
+            cls._timer = QTimer()
+            cls._timer.setInterval(cls.INTERVAL_MS)
+            cls._timer.timeout.connect(cls._tick)
+        if not cls._timer.isActive():
+            cls._timer.start()
+
+    @classmethod
+    def unsubscribe(cls, widget: "VoiceInputWidget"):
+        """Remove widget, stopping the timer when nobody is listening"""
+        cls._subscribers.discard(widget)
+        if not cls._subscribers and cls._timer is not None:
+            cls._timer.stop()
+
+    @classmethod
+    def _tick(cls):
+        for widget in list(cls._subscribers):
+            widget._log_heartbeat()
+
+
 class VoiceInputWidget(QWidget):
     """Voice input UI component"""
 
@@ -78,6 +111,10 @@ class VoiceInputWidget(QWidget):
     voice_result_ready = Signal(str)  # Voice recognition result ready
     voice_error_occurred = Signal(str)  # Voice recognition error
 
+    # Internal signals used to hop from the audio thread to the UI thread
+    _transcription_ready_internal = Signal(str)
+    _error_ready_internal = Signal(str)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger(__name__)
@@ -88,7 +125,16 @@ class VoiceInputWidget(QWidget):
         self.async_runner.start_loop()
 
         # Track active single-shot timers for proper cleanup
-        self._active_timers: set[QTimer] = set()
+        # (intrusive doubly-linked list threaded through the timers themselves)
+        self._active_timers_head: QTimer | None = None
+
+        # Queued connections deliver results to the main thread
+        self._transcription_ready_internal.connect(
+            self._update_transcription_ui, Qt.QueuedConnection
+        )
+        self._error_ready_internal.connect(
+            self._update_error_ui, Qt.QueuedConnection
+        )
 
         self._setup_ui()
         self._setup_shortcuts()
@@ -170,6 +216,7 @@ class VoiceInputWidget(QWidget):
             "Voice recognition results will be displayed here..."
         )
         self.result_text.setReadOnly(True)
+        self.result_text.setProperty("state", "normal")
         layout.addWidget(self.result_text)
 
     def _setup_shortcuts(self):
@@ -185,9 +232,7 @@ class VoiceInputWidget(QWidget):
         self.status_timer.timeout.connect(self._update_status)
         self.status_timer.start(100)  # Update status every 100ms
 
-        # Heartbeat log timer (used during recording)
-        self.heartbeat_timer = QTimer()
-        self.heartbeat_timer.timeout.connect(self._log_heartbeat)
+        # Heartbeat logging (used during recording) shares a class-level ticker
         self.heartbeat_counter = 0
 
     def _apply_styles(self):
@@ -223,6 +268,11 @@ class VoiceInputWidget(QWidget):
                 padding: 8px;
                 background-color: white;
             }
+            QTextEdit[state="error"] {
+                border: 1px solid #dc3545;
+                background-color: #f8d7da;
+                color: #721c24;
+            }
             QFrame {
                 background-color: white;
                 border-radius: 4px;
@@ -262,7 +312,7 @@ class VoiceInputWidget(QWidget):
             self.record_button.setChecked(True)
 
             # Start heartbeat logging
-            self.heartbeat_timer.start(5000)  # Log heartbeat every 5 seconds
+            _HeartbeatTicker.subscribe(self)  # Log heartbeat every 5 seconds
 
             # Clear previous results
             self.result_text.clear()
@@ -288,7 +338,7 @@ class VoiceInputWidget(QWidget):
             self.record_button.setChecked(False)
 
             # Stop heartbeat logging
-            self.heartbeat_timer.stop()
+            _HeartbeatTicker.unsubscribe(self)
 
             # Stop recording service
             self.async_runner.run_async(self.voice_service.stop_voice_input())
@@ -358,10 +408,8 @@ class VoiceInputWidget(QWidget):
             extra={"category": category.value},
         )
 
-        # Use QMetaObject.invokeMethod to ensure UI updates are executed in the main thread
-        QMetaObject.invokeMethod(
-            self, "_update_transcription_ui", Qt.QueuedConnection, Q_ARG(str, text)
-        )
+        # Queued signal ensures UI updates are executed in the main thread
+        self._transcription_ready_internal.emit(text)
 
         self.logger.info(
             f"[E2E-DEBUG] Voice recognition completed: {text[:50]}...",
@@ -372,25 +420,13 @@ class VoiceInputWidget(QWidget):
         """Handle errors"""
         error_text = f"{error_type}: {error_message}"
 
-        # Use QMetaObject.invokeMethod to ensure UI updates are executed in the main thread
-        QMetaObject.invokeMethod(
-            self, "_update_error_ui", Qt.QueuedConnection, Q_ARG(str, error_text)
-        )
+        # Queued signal ensures UI updates are executed in the main thread
+        self._error_ready_internal.emit(error_text)
 
     def _show_error(self, message: str):
         """Display error information"""
         self.result_text.setPlainText(f"Error: {message}")
-        self.result_text.setStyleSheet(
-            """
-            QTextEdit {
-                border: 1px solid #dc3545;
-                border-radius: 4px;
-                padding: 8px;
-                background-color: #f8d7da;
-                color: #721c24;
-            }
-        """
-        )
+        self._set_result_state("error")
         self.logger.error(
             f"Voice input error: {message}", extra={"category": category.value}
         )
@@ -400,16 +436,14 @@ class VoiceInputWidget(QWidget):
 
     def _reset_result_style(self):
         """Reset result display style"""
-        self.result_text.setStyleSheet(
-            """
-            QTextEdit {
-                border: 1px solid #ced4da;
-                border-radius: 4px;
-                padding: 8px;
-                background-color: white;
-            }
-        """
-        )
+        self._set_result_state("normal")
+
+    def _set_result_state(self, state: str):
+        """Switch result box style via dynamic property and re-polish"""
+        self.result_text.setProperty("state", state)
+        style = self.result_text.style()
+        style.unpolish(self.result_text)
+        style.polish(self.result_text)
 
 
 
@@ -465,7 +499,7 @@ class VoiceInputWidget(QWidget):
             )
         else:
             # If not in recording state, stop heartbeat
-            self.heartbeat_timer.stop()
+            _HeartbeatTicker.unsubscribe(self)
             self.logger.info(
                 "[HEARTBEAT] Recording ended, heartbeat logging stopped",
                 extra={"category": category.value},
@@ -498,18 +532,41 @@ class VoiceInputWidget(QWidget):
             timer = QTimer()
             timer.setSingleShot(True)
             timer.timeout.connect(lambda: self._on_timer_finished(timer, callback))
-            self._active_timers.add(timer)
+            self._link_timer(timer)
             timer.start(delay_ms)
             return timer
         except RuntimeError:
             # Qt object already deleted, ignore
             return None
 
+    def _link_timer(self, timer: QTimer):
+        """Push timer onto the head of the active-timer list"""
+        head = self._active_timers_head
+        timer._prev = None
+        timer._next = head
+        if head is not None:
+            head._prev = timer
+        self._active_timers_head = timer
+
+    def _unlink_timer(self, timer: QTimer):
+        """Splice timer out of the active-timer list (no-op if already unlinked)"""
+        prev = getattr(timer, "_prev", None)
+        next_timer = getattr(timer, "_next", None)
+        if prev is None and self._active_timers_head is not timer:
+            return
+        if prev is not None:
+            prev._next = next_timer
+        else:
+            self._active_timers_head = next_timer
+        if next_timer is not None:
+            next_timer._prev = prev
+        timer._prev = timer._next = None
+
     def _on_timer_finished(self, timer: QTimer, callback):
         """Handle timer completion and cleanup"""
         try:
             # Remove from active timers
-            self._active_timers.discard(timer)
+            self._unlink_timer(timer)
             # Execute callback
             if callback:
                 callback()
@@ -528,15 +585,19 @@ class VoiceInputWidget(QWidget):
             if sys.meta_path is None:
                 return  # Python is shutting down, skip cleanup
 
-            for timer in list(self._active_timers):
+            timer = self._active_timers_head
+            self._active_timers_head = None
+            while timer is not None:
+                next_timer = timer._next
+                timer._prev = timer._next = None
                 try:
-                    if timer and timer.thread() == self.thread():
+                    if timer.thread() == self.thread():
                         timer.stop()
                         timer.deleteLater()
                 except RuntimeError:
                     # Timer already deleted, ignore
                     pass
-            self._active_timers.clear()
+                timer = next_timer
         except (ImportError, RuntimeError, AttributeError):
             # Python is shutting down or Qt objects already deleted, ignore
             pass
@@ -556,9 +617,7 @@ class VoiceInputWidget(QWidget):
                 self.status_timer.stop()
                 self.status_timer = None
 
-            if hasattr(self, "heartbeat_timer") and self.heartbeat_timer:
-                self.heartbeat_timer.stop()
-                self.heartbeat_timer = None
+            _HeartbeatTicker.unsubscribe(self)
 
             # Clean up async task executor
             if hasattr(self, "async_runner") and self.async_runner:
@@ -4,8 +4,57 @@ Provides methods to integrate window context capture and restoration
 """
 
 from typing import Optional
+from PySide6.QtCore import QObject, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QGuiApplication
+
 from src.utils.loguru_config import logger, get_logger
 
+# Shared keyboard controller for fallback injection (pynput loaded on first use)
+_PYNPUT_KB = None
+
+# Texts longer than this are pasted in one Ctrl+V instead of typed per character
+_CLIPBOARD_INJECT_THRESHOLD = 32
+_CLIPBOARD_RESTORE_DELAY_MS = 500
+
+# Shared result for get_context_info when nothing is captured (treat as read-only)
+_NO_CTX = {"has_context": False}
+
+# Focus confirmation polling (replaces a fixed 100ms settle delay)
+_FOCUS_POLL_INTERVAL_MS = 5
+_FOCUS_POLL_MAX_ATTEMPTS = 10
+
+
+def _get_kb():
+    """Return the shared pynput keyboard controller, importing pynput lazily."""
+    global _PYNPUT_KB
+    if _PYNPUT_KB is None:
+        from pynput.keyboard import Controller
+        _PYNPUT_KB = Controller()
+    return _PYNPUT_KB
+
+
+def _get_foreground_hwnd() -> Optional[int]:
+    """Return the current foreground window handle, or None if unavailable."""
+    try:
+        import win32gui
+    except ImportError:
+        return None
+    return win32gui.GetForegroundWindow()
+
+
+def _get_context_hwnd(context) -> Optional[int]:
+    """Extract the target window handle from a captured context."""
+    hwnd = getattr(context, "hwnd", None)
+    if hwnd is None:
+        hwnd = getattr(getattr(context, "window_info", None), "hwnd", None)
+    return hwnd
+
+
+class _RestorationNotifier(QObject):
+    """Delivers background focus-restoration results to the GUI thread."""
+    
+    restoration_done = Signal(bool, object)  # success, (text, context) to inject or None
+
 
 class WindowContextIntegration:
     """
@@ -27,19 +76,40 @@ class WindowContextIntegration:
         self.logger = get_logger(__name__)
         self.hotkey_manager = hotkey_manager
         self._captured_context = None
+        # Bumped whenever the cached context is replaced or cleared
+        self._context_gen = 0
+        # (id(context), context.timestamp, info dict) from the last get_context_info
+        self._ctx_info_cache: Optional[tuple[int, float, dict]] = None
+        
+        # Off-thread focus restoration; each injection resumes when its own restore reports back
+        self._restore_notifier = _RestorationNotifier()
+        self._restore_notifier.restoration_done.connect(self._on_restoration_done)
         
         self.logger.info("WindowContextIntegration initialized")
     
-    def get_captured_context(self):
+    def get_captured_context(self, force: bool = False):
         """
         Get the window context captured by hotkey manager.
         
+        The hotkey manager's current context is a plain attribute read; it is
+        compared by identity with the cached one so a new hotkey capture
+        replaces the cache (and bumps _context_gen for the dict memos).
+        
+        Args:
+            force: Drop the cached context even if the capture is unchanged
+        
         Returns:
             WindowContext object or None
         """
-        if self.hotkey_manager:
-            return self.hotkey_manager.get_current_window_context()
-        return None
+        if not self.hotkey_manager:
+            return self._captured_context
+        
+        context = self.hotkey_manager.get_current_window_context()
+        if force or context is not self._captured_context:
+            self._captured_context = context
+            self._context_gen += 1
+            self._ctx_info_cache = None
+        return context
     
     def capture_current_context(self, trigger_source: str = "manual"):
         """
@@ -56,6 +126,7 @@ class WindowContextIntegration:
                 trigger_source=trigger_source
             )
             self._captured_context = context
+            self._context_gen += 1
             return context
         return None
     
@@ -69,30 +140,80 @@ class WindowContextIntegration:
         Returns:
             True if restoration successful
         """
-        try:
-            # Use provided context or get from hotkey manager
-            target_context = context or self.get_captured_context()
-            
-            if not target_context:
-                self.logger.warning("No window context to restore")
-                return False
-            
-            self.logger.info(f"Restoring focus to: {target_context.get_display_name()}")
-            
-            # Restore via hotkey manager
-            if self.hotkey_manager:
-                success = self.hotkey_manager.restore_window_context(target_context)
-                if success:
-                    self.logger.info("Window focus restored successfully")
-                else:
-                    self.logger.error("Failed to restore window focus")
-                return success
-            
+        if not self.hotkey_manager:
             return False
-            
+        
+        # Use provided context or get from hotkey manager
+        target_context = context or self.get_captured_context()
+        
+        if not target_context:
+            self.logger.warning("No window context to restore")
+            return False
+        
+        self.logger.info(f"Restoring focus to: {target_context.get_display_name()}")
+        
+        # Restore via hotkey manager
+        try:
+            success = self.hotkey_manager.restore_window_context(target_context)
         except Exception as e:
             self.logger.error(f"Error restoring window: {e}")
             return False
+        
+        if success:
+            self.logger.info("Window focus restored successfully")
+        else:
+            self.logger.error("Failed to restore window focus")
+        return success
+    
+    def restore_original_window_async(self, context=None, injection=None) -> bool:
+        """
+        Restore focus to the original window on a worker thread.
+        
+        The result is reported through _restore_notifier.restoration_done
+        on the GUI thread, so the floating window keeps repainting while
+        the OS focus switch is in progress.
+        
+        Args:
+            context: WindowContext to restore, or None to use captured context
+            injection: Optional (text, context) carried through to the result,
+                so concurrent restores each resume their own injection
+            
+        Returns:
+            True if restoration was started
+        """
+        if not self.hotkey_manager:
+            return False
+        
+        target_context = context or self.get_captured_context()
+        if not target_context:
+            self.logger.warning("No window context to restore")
+            return False
+        
+        hotkey_manager = self.hotkey_manager
+        notifier = self._restore_notifier
+        log = self.logger
+        
+        def restore():
+            try:
+                success = bool(hotkey_manager.restore_window_context(target_context))
+            except Exception as e:
+                log.error(f"Error restoring window: {e}")
+                success = False
+            notifier.restoration_done.emit(success, injection)
+        
+        QThreadPool.globalInstance().start(restore)
+        return True
+    
+    def _on_restoration_done(self, success: bool, injection):
+        """Resume the injection carried by a finished background restoration."""
+        if injection is None:
+            return
+        
+        if not success:
+            self.logger.warning("Failed to restore focus, attempting injection anyway")
+        
+        text, context = injection
+        self._confirm_focus_then_inject(text, context)
     
     def inject_to_original_window(self, text: str, restore_focus: bool = True) -> bool:
         """
@@ -103,37 +224,59 @@ class WindowContextIntegration:
             restore_focus: Whether to restore focus before injection
             
         Returns:
-            True if injection successful
+            With restore_focus, True only means the injection was scheduled:
+            it runs once focus is back and its failures are logged, not
+            returned. Otherwise, whether the injection succeeded.
         """
-        try:
-            if not text:
-                self.logger.warning("No text to inject")
-                return False
-            
-            # Get the original window context
-            context = self.get_captured_context()
-            if not context:
-                self.logger.warning("No window context available for injection")
-                # Fall back to injecting to current active window
-                return self._inject_to_active_window(text)
-            
-            self.logger.info(f"Injecting text to: {context.get_display_name()}")
-            
-            # Restore focus to original window if requested
-            if restore_focus:
-                if not self.restore_original_window(context):
-                    self.logger.warning("Failed to restore focus, attempting injection anyway")
-                
-                # Small delay to ensure window is focused
-                import time
-                time.sleep(0.1)
-            
-            # Inject text
-            return self._inject_to_active_window(text)
-            
-        except Exception as e:
-            self.logger.error(f"Error injecting to original window: {e}")
+        if not text:
+            self.logger.warning("No text to inject")
             return False
+        
+        # Get the original window context
+        context = self.get_captured_context()
+        if not context:
+            self.logger.warning("No window context available for injection")
+            # Fall back to injecting to current active window
+            return self._inject_to_active_window(text)
+        
+        self.logger.info(f"Injecting text to: {context.get_display_name()}")
+        
+        # Restore focus to original window if requested
+        if restore_focus:
+            # Inject once the window actually has focus instead of blocking the UI
+            if not self.restore_original_window_async(context, (text, context)):
+                self.logger.warning("Failed to restore focus, attempting injection anyway")
+                QTimer.singleShot(0, lambda: self._confirm_focus_then_inject(text, context))
+            return True
+        
+        # Inject text (failures are logged by _inject_to_active_window)
+        return self._inject_to_active_window(text)
+    
+    def _confirm_focus_then_inject(self, text: str, context, attempt: int = 0):
+        """
+        Poll until the original window is in the foreground, then inject.
+        
+        Injects at once when either handle is unknown (no hwnd in the context,
+        or no win32gui), since there is nothing to poll; otherwise gives up
+        waiting after _FOCUS_POLL_MAX_ATTEMPTS and injects anyway.
+        """
+        target_hwnd = _get_context_hwnd(context)
+        foreground = _get_foreground_hwnd()
+        if target_hwnd is None or foreground is None:
+            self._inject_to_active_window(text)
+            return
+        
+        focused = foreground == target_hwnd
+        if focused or attempt >= _FOCUS_POLL_MAX_ATTEMPTS:
+            if not focused:
+                self.logger.debug("Focus not confirmed, injecting anyway")
+            self._inject_to_active_window(text)
+            return
+        
+        QTimer.singleShot(
+            _FOCUS_POLL_INTERVAL_MS,
+            lambda: self._confirm_focus_then_inject(text, context, attempt + 1),
+        )
     
     def _inject_to_active_window(self, text: str) -> bool:
         """
@@ -145,34 +288,67 @@ class WindowContextIntegration:
         Returns:
             True if injection successful
         """
+        system_service = getattr(self, 'system_service', None)
+        use_clipboard = len(text) > _CLIPBOARD_INJECT_THRESHOLD
+        
         try:
             # Use system service if available
-            if hasattr(self, 'system_service') and self.system_service:
-                result = self.system_service.inject_text(text)
-                return result.success
+            if system_service:
+                return system_service.inject_text(text).success
             
             # Fallback: use pynput directly
-            from pynput.keyboard import Controller
-            keyboard = Controller()
-            keyboard.type(text)
-            return True
+            if use_clipboard:
+                return self._inject_via_clipboard(text)
             
+            _get_kb().type(text)
+            return True
         except Exception as e:
             self.logger.error(f"Text injection failed: {e}")
             return False
     
+    def _inject_via_clipboard(self, text: str) -> bool:
+        """
+        Paste text with a single Ctrl+V, restoring the clipboard afterwards.
+        
+        Args:
+            text: Text to inject
+            
+        Returns:
+            True if paste was sent
+        """
+        clipboard = QGuiApplication.clipboard()
+        previous_text = clipboard.text()
+        clipboard.setText(text)
+        
+        from pynput.keyboard import Key
+        keyboard = _get_kb()
+        with keyboard.pressed(Key.ctrl):
+            keyboard.tap("v")
+        
+        QTimer.singleShot(
+            _CLIPBOARD_RESTORE_DELAY_MS, lambda: clipboard.setText(previous_text)
+        )
+        return True
+    
     def get_context_info(self) -> dict:
         """
         Get information about the current window context.
         
+        The dictionary is cached per context and shared between calls,
+        so callers must not mutate it.
+        
         Returns:
             Dictionary with context information
         """
         context = self.get_captured_context()
         if not context:
-            return {"has_context": False}
+            return _NO_CTX
         
-        return {
+        cache = self._ctx_info_cache
+        if cache is not None and cache[0] == id(context) and cache[1] == context.timestamp:
+            return cache[2]
+        
+        info = {
             "has_context": True,
             "window_title": context.title,
             "process_name": context.process_name,
@@ -181,10 +357,14 @@ class WindowContextIntegration:
             "timestamp": context.timestamp,
             "is_valid": context.is_valid()
         }
+        self._ctx_info_cache = (id(context), context.timestamp, info)
+        return info
     
     def clear_context(self):
         """Clear the captured window context"""
         self._captured_context = None
+        self._context_gen += 1
+        self._ctx_info_cache = None
         if self.hotkey_manager and self.hotkey_manager.window_context_manager:
             self.hotkey_manager.window_context_manager.clear_current_context()
         self.logger.debug("Window context cleared")
@@ -192,26 +372,18 @@ class WindowContextIntegration:
 
 def add_context_integration_to_window(floating_window, hotkey_manager):
     """
-    Add window context integration methods to a FloatingWindow instance.
+    Bind a hotkey manager to a FloatingWindow's window context integration.
+    
+    FloatingWindow inherits WindowContextIntegration and initializes it in
+    its own __init__, so only the hotkey_manager attribute needs setting;
+    get_captured_context picks up the new manager's context on next use.
     
     Args:
         floating_window: FloatingWindow instance
         hotkey_manager: HotkeyManager instance with window context
     """
     try:
-        # Create integration instance
-        integration = WindowContextIntegration(hotkey_manager)
-        
-        # Add methods to floating window
-        floating_window.get_captured_context = integration.get_captured_context
-        floating_window.capture_current_context = integration.capture_current_context
-        floating_window.restore_original_window = integration.restore_original_window
-        floating_window.inject_to_original_window = integration.inject_to_original_window
-        floating_window.get_context_info = integration.get_context_info
-        floating_window.clear_context = integration.clear_context
-        
-        # Store integration instance
-        floating_window._context_integration = integration
+        floating_window.hotkey_manager = hotkey_manager
         
         logger.info("Window context integration added to FloatingWindow")
         return True
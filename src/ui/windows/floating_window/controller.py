@@ -3,16 +3,30 @@ Floating Window Controller
 Handles component initialization, window setup, and signal wiring.
 """
 
+from functools import cache
+
 from PySide6.QtWidgets import QWidget
 
 from src.utils.loguru_config import logger
 
 from .window_manager import WindowManager
 from .event_handler import EventHandler
-from .ui_components import UIComponentManager
+from .ui_components import UIComponentManager, COMPONENT_STYLESHEET
 from .renderer import WindowRenderer
+from .processing import ProcessingModule
+from .interaction import InteractionModule
 from ...widgets.positioning import WindowPositioning, PositionConfig
 
+# PositionConfig is immutable, so every window can start from the same instance
+_DEFAULT_POSITION_CONFIG = PositionConfig()
+
+
+@cache
+def _audio_service_cls():
+    """Resolve AudioService once; imported lazily to avoid a circular import."""
+    from src.services.audio import AudioService
+    return AudioService
+
 
 class FloatingWindowController:
     """
@@ -25,28 +39,41 @@ class FloatingWindowController:
     def __init__(self, window: QWidget):
         self.window = window
 
-    def init_components(self):
-        """Initialize all modular components (migrated from _init_components)."""
-        try:
-            # Core window management
-            self.window.window_manager = WindowManager(self.window, self.window.config_manager)
+    def bootstrap(self):
+        """Build, lay out and wire the whole window in one pass."""
+        w = self.window
 
-            # Event handling
-            self.window.event_handler = EventHandler(self.window)
+        self.init_components()
+        self.setup_window()
+        w._cache_component_handles()
 
-            # UI component management
-            self.window.ui_manager = UIComponentManager(self.window, self.window.config_manager)
+        # Processing must own the buffers/trigger manager before interaction caches them
+        processing = ProcessingModule(w)
+        w.processing = processing
+        processing.setup_buffers_and_processors()
+        w.interaction = InteractionModule(w)
 
-            # Rendering and animations
-            self.window.renderer = WindowRenderer(self.window, self.window.config_manager)
+        self.connect_signals()
 
-            # Window positioning
-            positioning_config = PositionConfig()
-            self.window.positioning = WindowPositioning(self.window, positioning_config)
+    def init_components(self):
+        """Initialize all modular components (migrated from _init_components)."""
+        try:
+            w = self.window
+            config_manager = w.config_manager
+
+            # (attribute, class, constructor args) in construction order
+            components = (
+                ("window_manager", WindowManager, (w, config_manager)),  # Core window management
+                ("event_handler", EventHandler, (w,)),  # Event handling
+                ("ui_manager", UIComponentManager, (w, config_manager)),  # UI component management
+                ("renderer", WindowRenderer, (w, config_manager)),  # Rendering and animations
+                ("positioning", WindowPositioning, (w, _DEFAULT_POSITION_CONFIG)),  # Window positioning
+            )
+            for attr, component_cls, args in components:
+                setattr(w, attr, component_cls(*args))
 
             # Audio service (替代原来的 VoiceService)
-            from src.services.audio import AudioService
-            self.window.voice_service = AudioService(self.window.config_manager)
+            w.voice_service = _audio_service_cls()(config_manager)
 
             logger.info(" All modular components initialized (controller)")
 
@@ -76,15 +103,15 @@ class FloatingWindowController:
             main_layout.addWidget(result_separator)
             main_layout.addWidget(result_container)
 
-            # Create hidden controls for compatibility
-            status_label, process_button = self.window.ui_manager.create_hidden_controls()
+            # Hidden compatibility controls are built on first access (ui_manager.hidden_controls)
 
             # Setup function selector
             function_selector = self.window.ui_manager.get_component("function_selector")
             if function_selector:
                 self.window.ui_manager.populate_function_selector(function_selector, self.window.ai_service_manager)
 
-            # Apply initial styling
+            # Apply initial styling; component rules share the window stylesheet
+            self.window.renderer.set_child_stylesheet(COMPONENT_STYLESHEET)
             self.window.renderer.apply_styling(0.9, "dark", 14)
 
             # Set initial window size
@@ -103,25 +130,33 @@ class FloatingWindowController:
     def connect_signals(self):
         """Connect signals between components (migrated from _connect_signals)."""
         try:
-            # Window manager signals
-            self.window.window_manager.state_changed.connect(self.window._on_window_state_changed)
-
-            # Event handler signals
-            self.window.event_handler.escape_pressed.connect(self.window.hide)
-            self.window.event_handler.enter_pressed.connect(self.window._on_enter_pressed)
-            self.window.event_handler.ctrl_enter_pressed.connect(self.window._on_ctrl_enter_pressed)
-
-            # Renderer signals
-            self.window.renderer.animation_finished.connect(self.window._on_animation_finished)
-
-            # Positioning signals
-            self.window.positioning.position_calculated.connect(self.window._on_position_calculated)
-            self.window.positioning.screen_changed.connect(self.window._on_screen_changed)
+            w = self.window
+            event_handler = w.event_handler
+            positioning = w.positioning
+            # Slots bind straight to the modules, not through window trampolines
+            interaction = w.interaction
+
+            connections = [
+                # Window manager signals
+                (w.window_manager.state_changed, interaction.on_window_state_changed),
+                # Event handler signals
+                (event_handler.escape_pressed, w.hide),
+                (event_handler.enter_pressed, interaction.on_enter_pressed),
+                (event_handler.ctrl_enter_pressed, interaction.on_ctrl_enter_pressed),
+                # Renderer signals
+                (w.renderer.animation_finished, interaction.on_animation_finished),
+                # Positioning signals
+                (positioning.position_calculated, interaction.on_position_calculated),
+                (positioning.screen_changed, interaction.on_screen_changed),
+            ]
 
             # Function selector signals
-            function_selector = self.window.ui_manager.get_component("function_selector")
+            function_selector = w.ui_manager.get_component("function_selector")
             if function_selector:
-                function_selector.currentIndexChanged.connect(self.window._on_agent_selection_changed)
+                connections.append((function_selector.currentIndexChanged, w.processing.on_agent_selection_changed))
+
+            for signal, slot in connections:
+                signal.connect(slot)
 
             logger.info(" Component signals connected (controller)")
 
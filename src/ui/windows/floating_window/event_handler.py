@@ -3,12 +3,17 @@ Event Handler Module - Extracted from FloatingWindow
 Handles keyboard and mouse events, hotkey processing.
 """
 
+import sys
+import weakref
 from typing import Optional, Dict, Callable
-from PySide6.QtCore import QObject, Signal, QEvent, Qt
+from PySide6.QtCore import QObject, Signal, QEvent, Qt, QTimer, SIGNAL
 from PySide6.QtGui import QKeyEvent, QMouseEvent, QFocusEvent
 from PySide6.QtWidgets import QWidget, QTextEdit
 
-from src.utils.loguru_config import logger, get_logger
+from src.utils.loguru_config import get_logger
+
+# Per-event trace logging; off by default so hot paths skip logger calls entirely
+_HOT_PATH_LOG_ENABLED = False
 
 
 class EventHandler(QObject):
@@ -21,55 +26,89 @@ class EventHandler(QObject):
     enter_pressed = Signal()
     ctrl_enter_pressed = Signal()
     
+    # Qt enum values pre-resolved to plain ints for hot-path comparisons
+    _ET_KEYPRESS = QEvent.Type.KeyPress.value
+    _ET_MPRESS = QEvent.Type.MouseButtonPress.value
+    _ET_MRELEASE = QEvent.Type.MouseButtonRelease.value
+    _ET_FOCUSOUT = QEvent.Type.FocusOut.value
+    _KEY_ESC = Qt.Key.Key_Escape.value
+    _KEY_RET = Qt.Key.Key_Return.value
+    _KEY_ENTER = Qt.Key.Key_Enter.value
+    _MOD_CTRL = Qt.KeyboardModifier.ControlModifier.value
+    _MOD_ALT = Qt.KeyboardModifier.AltModifier.value
+    _MOD_SHIFT = Qt.KeyboardModifier.ShiftModifier.value
+    
+    # Minimum spacing between autorepeat key_pressed emissions (~one frame)
+    _AUTOREPEAT_COALESCE_MS = 16
+    
+    # Event types eventFilter acts on; everything else returns immediately
+    _HANDLED_EVENTS = frozenset({_ET_KEYPRESS, _ET_MPRESS, _ET_MRELEASE, _ET_FOCUSOUT})
+    
     def __init__(self, window: QWidget):
-        super().__init__()
+        super().__init__(window)
         self.window = window
-        self.logger = get_logger()
+        self.logger = get_logger(__name__)
         
         # Event tracking
         self._key_modifiers = Qt.KeyboardModifier.NoModifier
         self._mouse_pressed = False
-        self._monitored_widgets: Dict[QWidget, bool] = {}
+        self._monitored_widgets: "weakref.WeakSet[QWidget]" = weakref.WeakSet()
         
         # Event callbacks for complex processing
         self._enter_callback: Optional[Callable[[str], None]] = None
         self._ctrl_enter_callback: Optional[Callable[[], None]] = None
         
-        logger.info("EventHandler initialized")
+        # Text widget whose content is handed to the Enter callback
+        self._primary_text_widget: Optional[QTextEdit] = None
+        
+        # (modifier_bits, key) -> interned key name
+        self._key_name_cache: Dict[tuple[int, int], str] = {}
+        
+        # Autorepeat key_pressed coalescing
+        self._pending_key_name: Optional[str] = None
+        self._key_flush_armed = False
+        
+        self.logger.info("EventHandler initialized")
     
     def install_event_filter(self, widget: QWidget) -> None:
         """Install event filter on a widget for monitoring."""
         widget.installEventFilter(self)
-        self._monitored_widgets[widget] = True
-        logger.info(f"Event filter installed on {widget.__class__.__name__}")
+        self._monitored_widgets.add(widget)
+        if self._primary_text_widget is None and isinstance(widget, QTextEdit):
+            self._primary_text_widget = widget
+        if _HOT_PATH_LOG_ENABLED:
+            self.logger.opt(lazy=True).trace(
+                "Event filter installed on {}", lambda: widget.__class__.__name__
+            )
     
     def remove_event_filter(self, widget: QWidget) -> None:
         """Remove event filter from a widget."""
         if widget in self._monitored_widgets:
+            self._monitored_widgets.discard(widget)
+            if widget is self._primary_text_widget:
+                self._primary_text_widget = None
             widget.removeEventFilter(self)
-            del self._monitored_widgets[widget]
-            logger.info(f"Event filter removed from {widget.__class__.__name__}")
+            if _HOT_PATH_LOG_ENABLED:
+                self.logger.opt(lazy=True).trace(
+                    "Event filter removed from {}", lambda: widget.__class__.__name__
+                )
     
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:
         """Qt event filter - main entry point for all events."""
-        try:
-            # Handle key press events
-            if event.type() == QEvent.Type.KeyPress:
-                return self.handle_key_event(event)
-            
-            # Handle mouse events
-            elif event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
-                return self.handle_mouse_event(event)
-            
-            # Handle focus events
-            elif event.type() == QEvent.Type.FocusOut:
-                return self.handle_focus_event(event)
-            
+        event_type = event.type().value
+        if event_type not in self._HANDLED_EVENTS:
             return False  # Let other handlers process
-            
-        except Exception as e:
-            logger.error(f"Event filter failed: {e}")
-            return False
+        
+        # Handle key press events (handlers guard their own failures)
+        if event_type == self._ET_KEYPRESS:
+            return self.handle_key_event(event)
+        
+        # Handle focus events
+        if event_type == self._ET_FOCUSOUT:
+            return self.handle_focus_event(event)
+        
+        # Handle mouse events
+        return self.handle_mouse_event(event)
     
     def handle_key_event(self, event: QKeyEvent) -> bool:
         """Handle keyboard events."""
@@ -77,57 +116,75 @@ class EventHandler(QObject):
             key = event.key()
             modifiers = event.modifiers()
             self._key_modifiers = modifiers
+            mods = modifiers.value
             
             # Handle special key combinations
-            if key == Qt.Key.Key_Escape:
+            if key == self._KEY_ESC:
                 self.escape_pressed.emit()
-                logger.info("Escape key pressed")
+                if _HOT_PATH_LOG_ENABLED:
+                    self.logger.trace("Escape key pressed")
                 return True
                 
-            elif key == Qt.Key.Key_Return or key == Qt.Key.Key_Enter:
-                if modifiers & Qt.KeyboardModifier.ControlModifier:
+            elif key == self._KEY_RET or key == self._KEY_ENTER:
+                if mods & self._MOD_CTRL:
                     self.ctrl_enter_pressed.emit()
                     # Execute callback if registered
                     if self._ctrl_enter_callback:
                         try:
                             self._ctrl_enter_callback()
                         except Exception as e:
-                            logger.error(f"Ctrl+Enter callback failed: {e}")
-                    logger.info("Ctrl+Enter pressed")
+                            self.logger.error(f"Ctrl+Enter callback failed: {e}")
+                    if _HOT_PATH_LOG_ENABLED:
+                        self.logger.trace("Ctrl+Enter pressed")
                 else:
                     self.enter_pressed.emit()
                     # Execute callback if registered
                     if self._enter_callback:
                         try:
-                            # Get text from the focused widget if it's a text widget
-                            text = ""
-                            if isinstance(event.source(), QTextEdit):
-                                text = event.source().toPlainText()
+                            text_widget = self._primary_text_widget
+                            text = text_widget.toPlainText() if text_widget else ""
                             self._enter_callback(text)
                         except Exception as e:
-                            logger.error(f"Enter callback failed: {e}")
-                    logger.info("Enter pressed")
+                            self.logger.error(f"Enter callback failed: {e}")
+                    if _HOT_PATH_LOG_ENABLED:
+                        self.logger.trace("Enter pressed")
                 return True
             
-            # Emit general key press signal
-            key_name = self._get_key_name(key, modifiers)
-            self.key_pressed.emit(key_name)
+            # Emit general key press signal (skip name building when nobody listens)
+            if self.receivers(self._KEY_PRESSED_SIGNATURE) > 0:
+                key_name = self._get_key_name(key, mods)
+                if event.isAutoRepeat():
+                    # Held keys emit at most once per frame
+                    self._pending_key_name = key_name
+                    if not self._key_flush_armed:
+                        self._key_flush_armed = True
+                        QTimer.singleShot(self._AUTOREPEAT_COALESCE_MS, self._flush_key_pressed)
+                else:
+                    self.key_pressed.emit(key_name)
             
             return False  # Let other handlers process
             
         except Exception as e:
-            logger.error(f"Key event handling failed: {e}")
+            self.logger.error(f"Key event handling failed: {e}")
             return False
     
+    def _flush_key_pressed(self) -> None:
+        """Emit the latest coalesced autorepeat key."""
+        self._key_flush_armed = False
+        key_name = self._pending_key_name
+        self._pending_key_name = None
+        if key_name is not None:
+            self.key_pressed.emit(key_name)
+    
     def set_enter_callback(self, callback: Callable[[str], None]) -> None:
         """Set callback for Enter key processing."""
         self._enter_callback = callback
-        logger.info("Enter callback registered")
+        self.logger.info("Enter callback registered")
     
     def set_ctrl_enter_callback(self, callback: Callable[[], None]) -> None:
         """Set callback for Ctrl+Enter key processing."""
         self._ctrl_enter_callback = callback
-        logger.info("Ctrl+Enter callback registered")
+        self.logger.info("Ctrl+Enter callback registered")
     
     def install_on_widget(self, widget: QWidget) -> None:
         """Install event filter on a specific widget."""
@@ -135,41 +192,46 @@ class EventHandler(QObject):
     
     def get_monitored_widgets(self) -> list[QWidget]:
         """Get list of monitored widgets."""
-        return list(self._monitored_widgets.keys())
+        return list(self._monitored_widgets)
     
     def handle_focus_event(self, event: QFocusEvent) -> bool:
         """Handle focus out events."""
         try:
-            if event.type() == QEvent.Type.FocusOut:
-                logger.info(" Focus lost from monitored widget")
+            if event.type().value == self._ET_FOCUSOUT:
+                if _HOT_PATH_LOG_ENABLED:
+                    self.logger.trace("Focus lost from monitored widget")
                 # Could trigger window hiding or other focus-related actions
                 return False  # Don't consume the event
             
             return False
             
         except Exception as e:
-            logger.error(f" Focus event handling failed: {e}")
+            self.logger.error(f" Focus event handling failed: {e}")
             return False
     
     def handle_mouse_event(self, event: QMouseEvent) -> bool:
         """Handle mouse events."""
         try:
-            if event.type() == QEvent.Type.MouseButtonPress:
+            event_type = event.type().value
+            if event_type == self._ET_MPRESS:
                 self._mouse_pressed = True
                 pos = event.position().toPoint()
                 self.mouse_clicked.emit(pos.x(), pos.y())
                 
-                logger.info(f"🖱️ Mouse clicked at ({pos.x()}, {pos.y()})")
+                if _HOT_PATH_LOG_ENABLED:
+                    self.logger.opt(lazy=True).trace(
+                        "🖱️ Mouse clicked at ({}, {})", lambda: pos.x(), lambda: pos.y()
+                    )
                 return True
                 
-            elif event.type() == QEvent.Type.MouseButtonRelease:
+            elif event_type == self._ET_MRELEASE:
                 self._mouse_pressed = False
                 return True
             
             return False
             
         except Exception as e:
-            logger.error(f"🖱️ Mouse event handling failed: {e}")
+            self.logger.error(f"🖱️ Mouse event handling failed: {e}")
             return False
     
     # Class-level key mapping for performance
@@ -191,23 +253,43 @@ class EventHandler(QObject):
         Qt.Key.Key_F10: "F10", Qt.Key.Key_F11: "F11", Qt.Key.Key_F12: "F12",
     }
     
-    def _get_key_name(self, key: int, modifiers: Qt.KeyboardModifier) -> str:
-        """Convert key and modifiers to readable string."""
-        key_parts = []
-        
-        # Use bitwise operations for better performance
-        if modifiers & Qt.KeyboardModifier.ControlModifier:
-            key_parts.append("Ctrl")
-        if modifiers & Qt.KeyboardModifier.AltModifier:
-            key_parts.append("Alt")
-        if modifiers & Qt.KeyboardModifier.ShiftModifier:
-            key_parts.append("Shift")
+    _KEY_PRESSED_SIGNATURE = SIGNAL("key_pressed(QString)")
+    _NAME_MODIFIER_MASK = _MOD_CTRL | _MOD_ALT | _MOD_SHIFT
+    
+    def _get_key_name(self, key: int, mods: int) -> str:
+        """Convert key and modifier bits to readable string (cached per combination)."""
+        mod_bits = mods & self._NAME_MODIFIER_MASK
+        # Unmodified letters/digits: Qt key codes equal ASCII, chr() needs no lookup
+        if not mod_bits and (0x41 <= key <= 0x5A or 0x30 <= key <= 0x39):
+            return chr(key)
         
-        # Use class-level mapping for better performance
-        key_name = self._KEY_MAP.get(key, f"Key_{key}")
-        key_parts.append(key_name)
+        cache_key = (mod_bits, key)
+        key_name = self._key_name_cache.get(cache_key)
+        if key_name is None:
+            key_name = sys.intern(self._build_key_name(key, mods))
+            self._key_name_cache[cache_key] = key_name
+        return key_name
+    
+    # Modifier prefixes indexed by Ctrl<<2 | Alt<<1 | Shift
+    _MOD_PREFIXES = (
+        "", "Shift+", "Alt+", "Alt+Shift+",
+        "Ctrl+", "Ctrl+Shift+", "Ctrl+Alt+", "Ctrl+Alt+Shift+",
+    )
+    
+    def _build_key_name(self, key: int, mods: int) -> str:
+        """Build the readable key string from scratch."""
+        mod_idx = (
+            (((mods & self._MOD_CTRL) != 0) << 2)
+            | (((mods & self._MOD_ALT) != 0) << 1)
+            | ((mods & self._MOD_SHIFT) != 0)
+        )
         
-        return "+".join(key_parts)
+        if 0x41 <= key <= 0x5A or 0x30 <= key <= 0x39:
+            key_name = chr(key)
+        else:
+            # Use class-level mapping for better performance
+            key_name = self._KEY_MAP.get(key, f"Key_{key}")
+        return self._MOD_PREFIXES[mod_idx] + key_name
     
     def is_mouse_pressed(self) -> bool:
         """Check if mouse is currently pressed."""
@@ -221,18 +303,24 @@ class EventHandler(QObject):
         """Clean up event handler resources."""
         try:
             # Remove event filters from all monitored widgets
-            for widget in list(self._monitored_widgets.keys()):
-                self.remove_event_filter(widget)
+            for widget in list(self._monitored_widgets):
+                try:
+                    self.remove_event_filter(widget)
+                except RuntimeError:
+                    # Underlying C++ widget already deleted
+                    self._monitored_widgets.discard(widget)
             
             # Clear callbacks
+            self._primary_text_widget = None
             self._enter_callback = None
             self._ctrl_enter_callback = None
             
             # Reset state
+            self._pending_key_name = None
             self._mouse_pressed = False
             self._key_modifiers = Qt.KeyboardModifier.NoModifier
             
-            logger.info("EventHandler cleanup completed")
+            self.logger.info("EventHandler cleanup completed")
             
         except Exception as e:
-            logger.error(f"EventHandler cleanup failed: {e}")
\ No newline at end of file
+            self.logger.error(f"EventHandler cleanup failed: {e}")
\ No newline at end of file
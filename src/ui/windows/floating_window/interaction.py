@@ -4,32 +4,136 @@ Owns user interactions, UI state transitions, animations, and window lifecycle.
 """
 
 from typing import Optional
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QObject, QRect, QRunnable, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import QWidget
 
 from src.utils.loguru_config import logger
 
 from .window_manager import WindowState
+from .context_integration import (
+    _FOCUS_POLL_INTERVAL_MS,
+    _FOCUS_POLL_MAX_ATTEMPTS,
+    _get_foreground_hwnd,
+)
 from ...widgets.positioning import PositionStrategy
 
 
+class _ProcessNotifier(QObject):
+    """Delivers AI processing results from the worker thread to the GUI thread."""
+
+    result_ready = Signal(int, str)  # run generation, processed text ("" on failure)
+
+
+class _ProcessRunnable(QRunnable):
+    """Runs ai_service_manager.process_text on a QThreadPool worker."""
+
+    def __init__(self, service, text: str, agent_type, window_context, generation: int,
+                 notifier: _ProcessNotifier):
+        super().__init__()
+        self._service = service
+        self._text = text
+        self._agent_type = agent_type
+        self._window_context = window_context
+        self._generation = generation
+        self._notifier = notifier
+
+    def run(self):
+        try:
+            result = self._service.process_text(
+                self._text,
+                self._agent_type,
+                window_context=self._window_context,
+            )
+        except Exception as e:
+            logger.error("AI processing failed: {}", e)
+            result = None
+        self._notifier.result_ready.emit(self._generation, result or "")
+
+
 class InteractionModule:
     """
     Encapsulates interaction logic to keep the main window lean.
     """
 
+    # State -> visibility of (result_separator, result_container, clear_button, upload_button);
+    # None leaves the widget alone (the clear button follows content in INPUT)
+    _STATE_VISIBILITY = {
+        WindowState.INITIAL: (False, False, False, False),
+        WindowState.INPUT: (True, False, None, False),
+        WindowState.COMPLETE: (True, True, True, True),
+    }
+
+    # Upper bound on idle timers kept by create_single_shot_timer
+    _TIMER_POOL_MAX = 4
+
     def __init__(self, window: QWidget):
         self.window = window
 
+        # State -> window height in px, from the renderer's three-state table
+        window_heights = window.renderer.window_heights
+        self._state_height = {state: window_heights[state.value] for state in WindowState}
+
+        # Component name -> widget, filled lazily from ui_manager
+        self._component_cache: dict[str, QWidget] = {}
+        window.ui_manager.component_created.connect(self._on_component_created)
+
+        # Built by the processing module before this module is created
+        self._trigger_manager = window.trigger_manager
+
+        # Whether the input has content, kept current from textChanged so the
+        # clear button check never re-serializes the document
+        self._has_input = False
+        input_text = self._get("input_text")
+        if input_text is not None:
+            input_text.textChanged.connect(self._on_input_text_changed)
+
+        # Idle single-shot timers kept for reuse by create_single_shot_timer
+        self._timer_pool: list[QTimer] = []
+
+        # Generation of the current Enter-key run (bumped to abandon one in flight)
+        # and the target window resolved when that run started
+        self._process_gen = 0
+        self._process_target = None
+
+        # AI results arrive from a worker thread and are handled on the GUI thread
+        self._process_notifier = _ProcessNotifier()
+        self._process_notifier.result_ready.connect(
+            self._on_processing_finished, Qt.QueuedConnection
+        )
+
+    def _get(self, name: str) -> Optional[QWidget]:
+        """Get a UI component, resolving it through ui_manager only once."""
+        widget = self._component_cache.get(name)
+        if widget is None:
+            widget = self.window.ui_manager.get_component(name)
+            if widget is not None:
+                self._component_cache[name] = widget
+        return widget
+
+    def _on_component_created(self, name: str, widget: QWidget):
+        """Drop a stale cache entry when ui_manager (re)creates a component."""
+        self._component_cache.pop(name, None)
+
+    def _on_input_text_changed(self):
+        """Refresh the cached input content flag."""
+        input_text = self._get("input_text")
+        # An empty QTextDocument still holds one paragraph separator
+        self._has_input = input_text is not None and input_text.document().characterCount() > 1
+
+    def invalidate_component_cache(self):
+        """Forget all cached components (call after the UI is rebuilt)."""
+        self._component_cache.clear()
+
     def show_window(self):
         """Show the floating window with positioning (migrated)."""
         try:
             result = self.window.positioning.calculate_position(PositionStrategy.CURSOR_FOLLOW)
             if result.success:
-                self.window.move(result.position)
+                self.window.setGeometry(QRect(result.position, self.window.size()))
 
+            # WindowStaysOnTopHint already puts the window on top when shown, so no raise_()
             self.window.show()
-            self.window.raise_()
             self.window.activateWindow()
 
             if self.window.config_manager.get("ui.floating_window.auto_focus", True):
@@ -38,222 +142,273 @@ class InteractionModule:
             logger.info(" Window shown")
 
         except Exception as e:
-            logger.error(f" Failed to show window: {e}")
+            logger.error(" Failed to show window: {}", e)
 
     def set_input_focus(self):
         """Set focus to input text field (migrated)."""
         try:
-            input_text = self.window.ui_manager.get_component("input_text")
+            input_text = self._get("input_text")
             if input_text:
-                self.create_single_shot_timer(10, lambda: input_text.setFocus())
-                self.create_single_shot_timer(100, lambda: input_text.setFocus())
+                input_text.setFocus(Qt.ActiveWindowFocusReason)
+                if self.window.focusWidget() is not input_text:
+                    # Activation not processed yet; retry once on the next loop iteration
+                    QTimer.singleShot(0, input_text.setFocus)
                 logger.info(" Input focus set")
         except Exception as e:
-            logger.error(f" Failed to set input focus: {e}")
+            logger.error(" Failed to set input focus: {}", e)
 
     def hide_window(self):
         """Hide the floating window (migrated)."""
         try:
             logger.info(" Starting to hide window")
 
-            self.window.hide()
+            # A result still in flight must not be injected after the window is gone
+            self._abandon_processing()
 
-            self.clear_window_content()
+            self.window.hide()
 
             self.window.window_manager.current_state = WindowState.INITIAL
             self.on_window_state_changed(WindowState.INITIAL)
 
             self.window.window_closed.emit()
 
+            # The window is already hidden, so clearing can wait for the next loop turn
+            QTimer.singleShot(0, self.clear_window_content)
+
             logger.info(" Window hidden successfully")
 
         except Exception as e:
-            logger.error(f" Failed to hide window: {e}")
+            logger.error(" Failed to hide window: {}", e)
 
     def clear_window_content(self):
         """Clear all window content (migrated)."""
         try:
-            input_text = self.window.ui_manager.get_component("input_text")
+            input_text = self._get("input_text")
             if input_text:
                 input_text.clear()
 
-            result_label = self.window.ui_manager.get_component("result_label")
+            result_label = self._get("result_label")
             if result_label:
                 result_label.clear()
 
-            if getattr(self.window, 'input_buffer', None):
-                self.window.input_buffer.clear()
-            if getattr(self.window, 'output_buffer', None):
-                self.window.output_buffer.clear()
+            # Both are declared (as None) in the window's __init__
+            input_buffer = self.window.input_buffer
+            if input_buffer is not None:
+                input_buffer.clear()
+            output_buffer = self.window.output_buffer
+            if output_buffer is not None:
+                output_buffer.clear()
 
             self.window.processed_text = ""
 
+            trigger_manager = self._trigger_manager
+            if trigger_manager is not None:
+                trigger_manager.cancel_pending_triggers()
+
             logger.info("Window content cleared")
 
         except Exception as e:
-            logger.error(f"Failed to clear window content: {e}")
+            logger.error("Failed to clear window content: {}", e)
 
     def on_window_state_changed(self, new_state: WindowState):
         """Handle window state changes (migrated)."""
         try:
             self.update_ui_for_state(new_state)
+            self.animate_to_height(self._state_height[new_state])
 
-            if new_state == WindowState.INITIAL:
-                self.animate_to_height(120)
-            elif new_state == WindowState.INPUT:
-                self.animate_to_height(184)
-            elif new_state == WindowState.COMPLETE:
-                self.animate_to_height(232)
-            else:
-                self.animate_to_height(120)
-
-            logger.info(f"Window state changed to: {new_state.value}")
+            logger.info("Window state changed to: {}", new_state.value)
 
         except Exception as e:
-            logger.error(f"Failed to handle state change: {e}")
+            logger.error("Failed to handle state change: {}", e)
 
     def update_ui_for_state(self, state: WindowState):
         """Update UI component visibility based on window state (migrated)."""
-        result_separator = self.window.ui_manager.get_component("result_separator")
-        result_container = self.window.ui_manager.get_component("result_container")
-        clear_button = self.window.ui_manager.get_component("clear_button")
-        upload_button = self.window.ui_manager.get_component("upload_button")
-
-        if state == WindowState.INITIAL:
-            if result_separator:
-                result_separator.hide()
-            if result_container:
-                result_container.hide()
-            if clear_button:
-                clear_button.hide()
-            if upload_button:
-                upload_button.hide()
-
-        elif state == WindowState.INPUT:
-            if result_separator:
-                result_separator.show()
-            if result_container:
-                result_container.hide()
-            if upload_button:
-                upload_button.hide()
-            self.update_clear_button_visibility()
-
-        elif state == WindowState.COMPLETE:
-            if result_separator:
-                result_separator.show()
-            if result_container:
-                result_container.show()
-            if clear_button:
-                clear_button.show()
-            if upload_button:
-                upload_button.show()
+        visibility = self._STATE_VISIBILITY.get(state)
+        if visibility is None:
+            return
+
+        widgets = (
+            self._get("result_separator"),
+            self._get("result_container"),
+            self._get("clear_button"),
+            self._get("upload_button"),
+        )
+
+        # Coalesce the visibility changes into a single repaint
+        self.window.setUpdatesEnabled(False)
+        try:
+            for widget, visible in zip(widgets, visibility, strict=True):
+                if widget is not None and visible is not None:
+                    widget.setVisible(visible)
+
+            if state == WindowState.INPUT:
+                self.update_clear_button_visibility()
+        finally:
+            self.window.setUpdatesEnabled(True)
+            self.window.update()
 
     def update_clear_button_visibility(self):
         """Update clear button visibility based on content existence (migrated)."""
-        clear_button = self.window.ui_manager.get_component("clear_button")
+        clear_button = self._get("clear_button")
         if not clear_button:
             return
 
-        input_text = self.window.ui_manager.get_component("input_text")
-        result_label = self.window.ui_manager.get_component("result_label")
+        if self._has_input:
+            clear_button.show()
+            return
 
-        has_input = bool(input_text.toPlainText().strip()) if input_text else False
+        # QLabel stores its text, so reading it back is cheap
+        result_label = self._get("result_label")
         has_output = bool(result_label.text().strip()) if result_label else False
-
-        if has_input or has_output:
-            clear_button.show()
-        else:
-            clear_button.hide()
+        clear_button.setVisible(has_output)
 
     def animate_to_height(self, target_height: int):
         """Animate window to target height (migrated)."""
         try:
+            # The renderer drops targets the window is already at
             self.window.renderer.animate_to_height(target_height)
-            logger.info(f"Animating to height: {target_height}px")
+            logger.info("Animating to height: {}px", target_height)
 
         except Exception as e:
-            logger.error(f"Animation failed: {e}")
-            self.window.setFixedSize(581, target_height)
+            logger.error("Animation failed: {}", e)
+            self.window.resize(self.window.width(), target_height)
 
     def on_enter_pressed(self):
         """Handle Enter key press - process text and inject result directly (migrated)."""
         try:
-            if hasattr(self.window, '_is_processing') and self.window._is_processing:
+            if self.window._is_processing:
                 logger.info("Already processing")
                 return
 
-            input_text = self.window.ui_manager.get_component("input_text")
+            input_text = self._get("input_text")
             if input_text:
                 text = input_text.toPlainText().strip()
                 if text:
                     self.window._is_processing = True
-                    if hasattr(self.window, 'trigger_manager'):
-                        self.window.trigger_manager.set_processing_state(True)
+                    if self._trigger_manager is not None:
+                        self._trigger_manager.set_processing_state(True)
                     self.process_and_inject_text(text)
                 else:
                     logger.info("No text to process")
 
         except Exception as e:
-            logger.error(f" Failed to handle Enter press: {e}")
+            logger.error(" Failed to handle Enter press: {}", e)
             self.window._is_processing = False
 
     def process_and_inject_text(self, text: str):
-        """Process text with AI and inject result to active application (migrated)."""
+        """Process text with AI off the GUI thread; the result is injected in _on_processing_finished."""
+        try:
+            logger.info("Processing and injecting text: {}...", text[:50])
+
+            if not self.window.ai_service_manager:
+                logger.error("AI service manager not available")
+                self._finish_processing()
+                return
+
+            # Inject into the window the request was made for, even if a
+            # new capture lands while the AI call runs
+            self._process_gen += 1
+            self._process_target = self._get_target_window()
+
+            runnable = _ProcessRunnable(
+                self.window.ai_service_manager,
+                text,
+                self.window.current_agent_type,
+                self.window._get_window_context_dict(),
+                self._process_gen,
+                self._process_notifier,
+            )
+            QThreadPool.globalInstance().start(runnable)
+
+        except Exception as e:
+            logger.error("Failed to process and inject text: {}", e)
+            self._finish_processing()
+
+    def _on_processing_finished(self, generation: int, processed_text: str):
+        """Inject the AI result into the active application."""
+        if generation != self._process_gen:
+            # Abandoned by hide_window; the latch was released there
+            logger.info("Discarding result of an abandoned processing run")
+            return
+
         try:
-            logger.info(f"Processing and injecting text: {text[:50]}...")
-
-            agent_type = self.window.current_agent_type
-            window_context = self.window._get_window_context_dict()
-
-            if self.window.ai_service_manager:
-                processed_text = self.window.ai_service_manager.process_text(
-                    text,
-                    agent_type,
-                    window_context=window_context,
-                )
-
-                if processed_text and processed_text.strip():
-                    if self.window.system_service:
-                        # Hide window first
-                        self.hide_window()
-                        # Small delay to ensure window focus is restored
-                        self.create_single_shot_timer(100, lambda: self.inject_with_system_service(processed_text))
-                    else:
-                        self._inject_with_clipboard_fallback(processed_text)
-                        self.hide_window()
-
-                    logger.info("Text processed and injected successfully")
+            if processed_text and processed_text.strip():
+                if self.window.system_service:
+                    # Target resolved at request time; hand focus straight back to it
+                    target_window = self._process_target
+                    self.hide_window()
+                    if target_window is not None:
+                        self.window.system_service.focus_window(target_window)
+                    self._inject_when_focused(processed_text, target_window)
                 else:
-                    logger.error("AI processing returned empty result")
+                    self._inject_with_clipboard_fallback(processed_text)
+                    self.hide_window()
+
+                logger.info("Text processed and injected successfully")
             else:
-                logger.error("AI service manager not available")
+                logger.error("AI processing returned empty result")
 
         except Exception as e:
-            logger.error(f"Failed to process and inject text: {e}")
+            logger.error("Failed to inject processed text: {}", e)
         finally:
-            self.window._is_processing = False
-            if hasattr(self.window, 'trigger_manager'):
-                self.window.trigger_manager.set_processing_state(False)
+            self._finish_processing()
+
+    def _abandon_processing(self):
+        """Drop the in-flight Enter run, if any, and release the processing latch."""
+        if self.window._is_processing:
+            self._process_gen += 1
+            self._process_target = None
+            self._finish_processing()
+
+    def _finish_processing(self):
+        """Release the processing latch so new Enter presses are accepted."""
+        self.window._is_processing = False
+        if self._trigger_manager is not None:
+            self._trigger_manager.set_processing_state(False)
+
+    def _get_target_window(self):
+        """Get the SystemWindowInfo of the captured window, or None."""
+        if self.window.captured_window_context and self.window.window_context_manager:
+            return self.window.window_context_manager._get_system_window_info(
+                self.window.captured_window_context
+            )
+        return None
+
+    def _inject_when_focused(self, text: str, target_window, attempt: int = 0):
+        """
+        Poll until focus has left the floating window, then inject.
+
+        With a captured target, waits for that window to be in the foreground;
+        gives up waiting after _FOCUS_POLL_MAX_ATTEMPTS and injects anyway.
+        """
+        foreground = _get_foreground_hwnd()
+        if target_window is not None:
+            focused = foreground == target_window.hwnd
+        else:
+            focused = foreground != int(self.window.winId())
+
+        if foreground is None or focused or attempt >= _FOCUS_POLL_MAX_ATTEMPTS:
+            self.inject_with_system_service(text, target_window)
+            return
+
+        QTimer.singleShot(
+            _FOCUS_POLL_INTERVAL_MS,
+            lambda: self._inject_when_focused(text, target_window, attempt + 1),
+        )
 
-    def inject_with_system_service(self, text: str):
+    def inject_with_system_service(self, text: str, target_window=None):
         """Inject text using SystemIntegrationService (migrated)."""
         try:
-            target_window = None
-            if self.window.captured_window_context and self.window.window_context_manager:
-                try:
-                    target_window = self.window.window_context_manager._convert_to_system_window_info(
-                        self.window.captured_window_context.window_info
-                    )
-                    logger.info(f"Using captured window context for text injection: {target_window.title}")
-                except Exception as e:
-                    logger.exception(f"Failed to convert captured window context: {e}")
-                    target_window = None
+            if target_window is None:
+                target_window = self._get_target_window()
+            if target_window is not None:
+                logger.info("Using captured window context for text injection: {}", target_window.title)
 
             result = self.window.system_service.inject_text(text, target_window=target_window)
             if result.success:
-                logger.info(f"Text injection successful using {result.method_used.value}")
+                logger.info("Text injection successful using {}", result.method_used.value)
             else:
-                logger.error(f"Text injection failed: {result.error_message}")
+                logger.error("Text injection failed: {}", result.error_message)
 
         except Exception as e:
             logger.exception("Exception in system service injection")
@@ -261,31 +416,38 @@ class InteractionModule:
     def on_ctrl_enter_pressed(self):
         """Handle Ctrl+Enter key press (migrated)."""
         try:
-            result_label = self.window.ui_manager.get_component("result_label")
+            result_label = self._get("result_label")
             if result_label and result_label.text():
                 self.window.text_processed.emit(result_label.text())
                 self.hide_window()
 
         except Exception as e:
-            logger.error(f" Failed to handle Ctrl+Enter press: {e}")
+            logger.error(" Failed to handle Ctrl+Enter press: {}", e)
 
     def on_animation_finished(self, animation_name: str):
         """Handle animation completion (migrated)."""
-        logger.info(f" Animation completed: {animation_name}")
+        logger.info(" Animation completed: {}", animation_name)
 
     def on_position_calculated(self, position, strategy: str):
         """Handle position calculation (migrated)."""
-        logger.info(f" Position calculated: ({position.x()}) using {strategy}")
+        logger.opt(lazy=True).info(" Position calculated: ({}) using {}", lambda: position.x(), lambda: strategy)
 
     def on_screen_changed(self, screen):
         """Handle screen change (migrated)."""
-        logger.info(f" Screen changed to: {screen.name() if screen else 'Unknown'}")
+        logger.opt(lazy=True).info(" Screen changed to: {}", lambda: screen.name() if screen else "Unknown")
 
     def create_single_shot_timer(self, delay_ms: int, callback):
-        """Create a tracked single-shot timer for proper cleanup (migrated)."""
+        """Start a tracked single-shot timer, reusing an idle pooled QTimer if available."""
         try:
-            timer = QTimer()
-            timer.setSingleShot(True)
+            if self._timer_pool:
+                timer = self._timer_pool.pop()
+                timer.timeout.disconnect()
+            else:
+                # Parented to the window so Qt keeps it alive while it is tracked weakly
+                timer = QTimer(self.window)
+                timer.setSingleShot(True)
+                active_timers = self.window._active_timers
+                timer.destroyed.connect(lambda _=None, t=timer: active_timers.discard(t))
             timer.timeout.connect(lambda: self.on_timer_finished(timer, callback))
             self.window._active_timers.add(timer)
             timer.start(delay_ms)
@@ -294,20 +456,30 @@ class InteractionModule:
             return None
 
     def on_timer_finished(self, timer, callback):
-        """Handle timer completion and cleanup (migrated)."""
+        """Handle timer completion and return the timer to the pool (migrated)."""
         try:
             self.window._active_timers.discard(timer)
             if callback:
                 callback()
-            timer.deleteLater()
         except RuntimeError:
+            # The window or a widget the callback touches is already deleted
             pass
+        except Exception as e:
+            logger.error("Timer callback failed: {}", e)
+        finally:
+            # Always pool or release the timer so it never outlives its use
+            try:
+                if len(self._timer_pool) < self._TIMER_POOL_MAX:
+                    self._timer_pool.append(timer)
+                else:
+                    timer.deleteLater()
+            except RuntimeError:
+                pass
 
     # Internal helper used when system_service is not available
     def _inject_with_clipboard_fallback(self, text: str):
         try:
-            import pyperclip
-            pyperclip.copy(text)
+            QGuiApplication.clipboard().setText(text)
             logger.info("Copied text to clipboard as fallback")
         except Exception as e:
-            logger.error(f"Clipboard fallback failed: {e}")
\ No newline at end of file
+            logger.error("Clipboard fallback failed: {}", e)
\ No newline at end of file
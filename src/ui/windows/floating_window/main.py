@@ -6,8 +6,15 @@ Refactor status:
 - Delegates responsibilities to controller, renderer, interaction, processing, and UI components.
 """
 
-from typing import Optional
-from PySide6.QtCore import Signal
+import functools
+import heapq
+import itertools
+import time
+import weakref
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Mapping, Optional
+from PySide6.QtCore import QObject, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import QWidget
 
 from .window_manager import WindowManager, WindowState
@@ -15,9 +22,8 @@ from .event_handler import EventHandler
 from .ui_components import UIComponentManager
 from .renderer import WindowRenderer
 from ...widgets.positioning import WindowPositioning, PositionConfig, PositionStrategy
-from .processing import ProcessingModule
-from .interaction import InteractionModule
 from .controller import FloatingWindowController
+from .context_integration import WindowContextIntegration, _get_foreground_hwnd
 
 from src.platform_integration.system_integration import create_system_integration_service
 from src.services.ai.ai_service import AIService
@@ -30,8 +36,88 @@ try:
 except ImportError:
     WindowContextManager = None
 
+# Keys of the AI window-context dict and the matching WindowContext attributes
+_CONTEXT_DICT_KEYS = ('window_title', 'process_name', 'process_id', 'trigger_source', 'timestamp', 'class_name')
+_extract_context_fields = attrgetter('title', 'process_name', 'process_id', 'trigger_source', 'timestamp', 'class_name')
 
-class ModularFloatingWindow(QWidget):
+# update_settings keys that require restyling / repositioning
+_STYLING_KEYS = frozenset({"transparency", "theme", "font_size"})
+_POSITIONING_KEYS = frozenset({"cursor_offset_x", "cursor_offset_y", "boundary_margin", "occlusion_threshold"})
+
+
+def _log_errors(default=None):
+    """Log and swallow exceptions from a cold-path compatibility method, returning default."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                logger.error(" {} failed: {}", fn.__name__, e)
+                return default
+        return wrapper
+    return decorator
+
+
+class _PendingCapture:
+    """Result slot for one off-thread window context capture."""
+    
+    __slots__ = ("hwnd", "context")
+    
+    def __init__(self, hwnd: Optional[int]):
+        self.hwnd = hwnd
+        self.context = None
+
+
+class _TimerWheel:
+    """Runs delayed callbacks from a min-heap of due times on one shared single-shot QTimer."""
+    
+    __slots__ = ("_timer", "_heap", "_seq")
+    
+    def __init__(self, parent: QObject):
+        self._timer = QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+        self._heap: list = []  # (due perf_counter_ns, seq, callback)
+        self._seq = itertools.count()
+    
+    def schedule(self, delay_ms: int, callback):
+        """Run callback on the GUI thread after delay_ms."""
+        seq = next(self._seq)
+        heapq.heappush(self._heap, (time.perf_counter_ns() + delay_ms * 1_000_000, seq, callback))
+        if self._heap[0][1] == seq:
+            self._arm()
+    
+    def clear(self):
+        """Drop all pending callbacks."""
+        self._heap.clear()
+        self._timer.stop()
+    
+    def _arm(self):
+        if not self._heap:
+            self._timer.stop()
+            return
+        remaining_ns = self._heap[0][0] - time.perf_counter_ns()
+        self._timer.start(max(0, -(-remaining_ns // 1_000_000)))
+    
+    def _fire(self):
+        now = time.perf_counter_ns()
+        while self._heap and self._heap[0][0] <= now:
+            callback = heapq.heappop(self._heap)[2]
+            try:
+                callback()
+            except Exception as e:
+                logger.error("Delayed callback failed: {}", e)
+        self._arm()
+
+
+class _CaptureNotifier(QObject):
+    """Delivers finished window context captures to the GUI thread."""
+    
+    captured = Signal(object)  # _PendingCapture
+
+
+class ModularFloatingWindow(QWidget, WindowContextIntegration):
     """
     Modular floating window implementation using extracted components.
     
@@ -41,6 +127,7 @@ class ModularFloatingWindow(QWidget):
     - UIComponentManager: UI element creation and layout management
     - WindowRenderer: Qt native rendering and animations
     - WindowPositioning: Cursor following and multi-monitor support
+    - WindowContextIntegration (mixin): Original window capture, restore and injection
     """
     
     # Signals
@@ -49,6 +136,7 @@ class ModularFloatingWindow(QWidget):
     
     def __init__(self, config_manager: ConfigManager, ai_service_manager: AIService):
         super().__init__()
+        WindowContextIntegration.__init__(self)
         self.logger = logger
         self.config_manager = config_manager
         self.ai_service_manager = ai_service_manager
@@ -61,6 +149,17 @@ class ModularFloatingWindow(QWidget):
         # Window context manager for cursor recovery
         self.window_context_manager = None
         self.captured_window_context = None
+        # (context generation, integration context, captured context, read-only dict)
+        # memoized by _get_window_context_dict
+        self._ctx_dict_cache: Optional[tuple] = None
+        # (text, button_number, role_number) of the last applied external input
+        self._last_external_input: Optional[tuple] = None
+        # (config revision, parsed positioning ints) used by _configure_positioning
+        self._positioning_config_cache: Optional[tuple] = None
+        # Off-thread capture started by capture_window_context, if not yet applied
+        self._pending_capture: Optional[_PendingCapture] = None
+        self._capture_notifier = _CaptureNotifier()
+        self._capture_notifier.captured.connect(self._apply_capture)
         if WindowContextManager and self.system_service:
             self.window_context_manager = WindowContextManager(self.system_service)
             logger.info("WindowContextManager initialized")
@@ -69,31 +168,34 @@ class ModularFloatingWindow(QWidget):
         self._current_agent_type = "translation"  # Default agent type
         self.processed_text = ""  # Store processed text result
         self._is_processing = False  # Flag to prevent duplicate processing
+        self._current_request_id: Optional[int] = None  # Async processor request in flight
         
-        # Initialize active timers tracking
-        self._active_timers: set = set()
+        # Initialize active timers tracking (timers are owned by the window)
+        self._active_timers: weakref.WeakSet = weakref.WeakSet()
+        # Delayed hides share one timer instead of allocating one per call
+        self._wheel = _TimerWheel(self)
         
         # Initialize buffers and processors (will be set up later)
         self.input_buffer = None
         self.output_buffer = None
         self.trigger_manager = None
         self.async_processor = None
+        self.voice_service = None
         
-        # Initialize modular components via controller
+        # Build components, processing/interaction modules and signal wiring via controller
         self.controller = FloatingWindowController(self)
-        self.controller.init_components()
-        self.controller.setup_window()
-
-        # Setup processing and interaction modules
-        self.processing = ProcessingModule(self)
-        self.processing.setup_buffers_and_processors()
-        self.interaction = InteractionModule(self)
-
-        # Connect signals via controller
-        self.controller.connect_signals()
+        self.controller.bootstrap()
         
         logger.info(" ModularFloatingWindow initialized")
     
+    def _cache_component_handles(self, clear: bool = False):
+        """Snapshot (or drop) the widget handles behind the compatibility properties."""
+        get = (lambda _name: None) if clear else self.ui_manager.get_component
+        self._w_input_text = get("input_text")
+        self._w_result_label = get("result_label")
+        self._w_function_selector = get("function_selector")
+        self._w_voice_button = get("voice_button")
+    
     def _init_components(self):
         """Delegate to controller for component initialization."""
         self.controller.init_components()
@@ -110,47 +212,6 @@ class ModularFloatingWindow(QWidget):
         """Delegate to controller for signal wiring."""
         self.controller.connect_signals()
     
-    # Buffer and processor event handlers
-    def _on_input_buffer_changed(self, text: str):
-        """Delegate to processing module for input change handling."""
-        self.processing.on_input_buffer_changed(text)
-    
-    def _on_agent_selection_changed(self, index: int):
-        """Delegate to processing module for agent selection changes."""
-        self.processing.on_agent_selection_changed(index)
-    
-    def _on_output_updated(self, content: str):
-        """Delegate to processing module for output updates."""
-        self.processing.on_output_updated(content)
-    
-    def _on_output_state_changed(self, state: str):
-        """Delegate to processing module for output state changes."""
-        self.processing.on_output_state_changed(state)
-    
-    def _on_processing_triggered(self, trigger_type: str, text: str, agent_name: str):
-        """Delegate to processing module for processing trigger."""
-        self.processing.on_processing_triggered(trigger_type, text, agent_name)
-    
-    def _on_trigger_cancelled(self, trigger_type: str):
-        """Delegate to processing module for trigger cancellation."""
-        self.processing.on_trigger_cancelled(trigger_type)
-    
-    def _on_async_processing_started(self, request_id: int, agent_name: str):
-        """Delegate to processing module for async start."""
-        self.processing.on_async_processing_started(request_id, agent_name)
-    
-    def _on_async_processing_completed(self, request_id: int, agent_name: str, result: str):
-        """Delegate to processing module for async completion."""
-        self.processing.on_async_processing_completed(request_id, agent_name, result)
-    
-    def _on_async_processing_failed(self, request_id: int, agent_name: str, error: str):
-        """Delegate to processing module for async failure."""
-        self.processing.on_async_processing_failed(request_id, agent_name, error)
-    
-    def _on_async_processing_cancelled(self, request_id: int, agent_name: str):
-        """Delegate to processing module for async cancellation."""
-        self.processing.on_async_processing_cancelled(request_id, agent_name)
-    
     def show_window(self):
         """Delegate to interaction module to show window."""
         self.interaction.show_window()
@@ -167,10 +228,6 @@ class ModularFloatingWindow(QWidget):
         """Delegate to interaction module to clear content."""
         self.interaction.clear_window_content()
     
-    def _on_window_state_changed(self, new_state: WindowState):
-        """Delegate to interaction module for state change handling."""
-        self.interaction.on_window_state_changed(new_state)
-    
     def _update_ui_for_state(self, state: WindowState):
         """Delegate to interaction module to update UI for state."""
         self.interaction.update_ui_for_state(state)
@@ -183,10 +240,6 @@ class ModularFloatingWindow(QWidget):
         """Delegate to interaction module to animate window height."""
         self.interaction.animate_to_height(target_height)
     
-    def _on_enter_pressed(self):
-        """Delegate to interaction module for Enter key handling."""
-        self.interaction.on_enter_pressed()
-    
     def _process_and_inject_text(self, text: str):
         """Delegate to interaction module to process and inject text."""
         self.interaction.process_and_inject_text(text)
@@ -195,24 +248,6 @@ class ModularFloatingWindow(QWidget):
         """Delegate to interaction module to inject via system service."""
         self.interaction.inject_with_system_service(text)
     
-
-    
-    def _on_ctrl_enter_pressed(self):
-        """Delegate to interaction module for Ctrl+Enter handling."""
-        self.interaction.on_ctrl_enter_pressed()
-    
-    def _on_animation_finished(self, animation_name: str):
-        """Delegate to interaction module for animation finished."""
-        self.interaction.on_animation_finished(animation_name)
-    
-    def _on_position_calculated(self, position, strategy: str):
-        """Delegate to interaction module for position calculated."""
-        self.interaction.on_position_calculated(position, strategy)
-    
-    def _on_screen_changed(self, screen):
-        """Delegate to interaction module for screen changed."""
-        self.interaction.on_screen_changed(screen)
-    
     def _create_single_shot_timer(self, delay_ms: int, callback):
         """Delegate to interaction module to create tracked timer."""
         return self.interaction.create_single_shot_timer(delay_ms, callback)
@@ -223,179 +258,187 @@ class ModularFloatingWindow(QWidget):
     
     # Backward compatibility methods
     
+    @_log_errors()
     def show_at_cursor(self, clear_content: bool = False):
         """Show window at cursor position (backward compatibility method)."""
-        try:
-            if clear_content:
-                self.clear_content()
-            
-            self.show_window()
-            logger.info(" Window shown at cursor (compatibility method)")
-            
-        except Exception as e:
-            logger.error(f" Failed to show at cursor: {e}")
+        if clear_content:
+            self.clear_content()
+        
+        self.show_window()
+        logger.info(" Window shown at cursor (compatibility method)")
     
+    @_log_errors()
     def clear_content(self):
         """Clear window content and return to initial state."""
-        try:
-            self._clear_window_content()
-            logger.info(" Content cleared")
-            
-        except Exception as e:
-            logger.error(f" Failed to clear content: {e}")
+        self._clear_window_content()
+        logger.info(" Content cleared")
     
+    @_log_errors()
     def set_agent_type(self, agent_type: str):
         """Set the current agent type (backward compatibility method)."""
-        try:
-            self._current_agent_type = agent_type
-            
-            function_selector = self.ui_manager.get_component("function_selector")
-            if function_selector:
-                # Find the item with matching agent type
-                for i in range(function_selector.count()):
-                    if function_selector.itemData(i) == agent_type:
-                        function_selector.setCurrentIndex(i)
-                        break
-            
-            logger.info(f" Agent type set to: {agent_type}")
-            
-        except Exception as e:
-            logger.error(f" Failed to set agent type: {e}")
+        self._current_agent_type = agent_type
+        
+        function_selector = self._w_function_selector
+        if function_selector:
+            index = self.ui_manager.function_selector_index_for(agent_type)
+            if index is not None:
+                function_selector.setCurrentIndex(index)
+        
+        logger.info(f" Agent type set to: {agent_type}")
     
     def get_input_text(self) -> str:
         """Get current input text (backward compatibility method)."""
-        try:
-            input_text = self.ui_manager.get_component("input_text")
-            if input_text:
-                return input_text.toPlainText()
-            return ""
-            
-        except Exception as e:
-            logger.error(f" Failed to get input text: {e}")
-            return ""
+        input_text = self._w_input_text
+        if input_text:
+            return input_text.toPlainText()
+        return ""
     
+    @_log_errors()
     def set_result_text(self, text: str):
         """Set result text (backward compatibility method)."""
-        try:
-            result_label = self.ui_manager.get_component("result_label")
-            if result_label:
-                result_label.setText(text)
-            
-            # Update processed text
-            self.processed_text = text
-            
-            # Show complete state if text is provided
-            if text.strip():
-                self.window_manager.current_state = WindowState.COMPLETE
-                self._on_window_state_changed(WindowState.COMPLETE)
-            
-            logger.info(f" Result text set: {text[:50]}...")
-            
-        except Exception as e:
-            logger.error(f" Failed to set result text: {e}")
+        result_label = self._w_result_label
+        if result_label:
+            result_label.setText(text)
+        
+        # Update processed text
+        self.processed_text = text
+        
+        # Show complete state if text is provided
+        if text.strip():
+            self.window_manager.current_state = WindowState.COMPLETE
+            self.interaction.on_window_state_changed(WindowState.COMPLETE)
+        
+        logger.opt(lazy=True).info(" Result text set: {}...", lambda: text[:50])
     
+    @_log_errors()
     def hide_window_delayed(self, delay_ms: int = 3000):
         """Hide window after delay (backward compatibility method)."""
-        try:
-            self._create_single_shot_timer(delay_ms, self.hide_window)
-            logger.info(f" Window will hide in {delay_ms}ms")
-            
-        except Exception as e:
-            logger.error(f" Failed to setup delayed hide: {e}")
+        self._wheel.schedule(delay_ms, self.hide_window)
+        logger.info(f" Window will hide in {delay_ms}ms")
     
+    @_log_errors(default="")
     def capture_selected_text(self):
         """Capture selected text from the system (for backward compatibility)."""
-        try:
-            if self.system_service:
-                selected_text = self.system_service.capture_selected_text()
-                if selected_text:
-                    logger.info(f"Captured selected text: {selected_text[:50]}...")
-                    return selected_text
-                else:
-                    logger.info("No selected text found")
-                    return ""
-            return ""
-            
-        except Exception as e:
-            logger.error(f" Failed to capture selected text: {e}")
-            return ""
+        if self.system_service:
+            selected_text = self.system_service.capture_selected_text()
+            if selected_text:
+                logger.opt(lazy=True).info("Captured selected text: {}...", lambda: selected_text[:50])
+                return selected_text
+            else:
+                logger.info("No selected text found")
+                return ""
+        return ""
     
     def capture_window_context(self):
-        """Capture the current window context before showing floating window"""
-        try:
-            if self.window_context_manager:
-                self.captured_window_context = self.window_context_manager.capture_context()
-                if self.captured_window_context:
-                    logger.info(f" Window context captured: {self.captured_window_context.window_info.title}")
-                else:
-                    logger.error(" Failed to capture window context")
-        except Exception as e:
-            logger.error(f" Error capturing window context: {e}")
-    
-    def _get_window_context_dict(self) -> Optional[dict]:
+        """
+        Capture the current window context before showing floating window
+        
+        The foreground window handle is read here, before the floating window
+        is shown and can take the foreground itself. The slower title/process
+        queries for that handle run on a worker thread and the result is
+        applied on the GUI thread.
+        """
+        if not self.window_context_manager:
+            return
+        
+        capture = _PendingCapture(_get_foreground_hwnd())
+        self._pending_capture = capture
+        # The previous hotkey's window must not be targeted while this one resolves
+        self.captured_window_context = None
+        self._ctx_dict_cache = None
+        manager = self.window_context_manager
+        notifier = self._capture_notifier
+        
+        def run():
+            try:
+                capture.context = manager.capture_context(capture.hwnd)
+            except Exception as e:
+                logger.error(f" Error capturing window context: {e}")
+            notifier.captured.emit(capture)
+        
+        QThreadPool.globalInstance().start(run)
+    
+    def _apply_capture(self, capture: _PendingCapture):
+        """Adopt a finished capture unless a newer one has been started since."""
+        if capture is not self._pending_capture:
+            return
+        self._pending_capture = None
+        self.captured_window_context = capture.context
+        self._ctx_dict_cache = None
+        if capture.context:
+            logger.info(f" Window context captured: {capture.context.window_info.title}")
+        else:
+            logger.error(" Failed to capture window context")
+    
+    def _get_window_context_dict(self) -> Optional[Mapping]:
         """
         Get window context as a dictionary for AI processing
         
+        The result is cached until a new context is captured and shared
+        between requests, so it is returned as a read-only mapping.
+        
         Returns:
-            Optional[dict]: Window context information or None
+            Optional[Mapping]: Window context information or None
         """
         try:
+            if self._pending_capture is not None:
+                # Never block the GUI thread; _apply_capture resets the cache when it lands
+                logger.debug(" Window context capture still pending, continuing without it")
+            
             # Try to get context from context integration first
-            if hasattr(self, 'get_captured_context'):
-                context = self.get_captured_context()
-                if context:
-                    return {
-                        'window_title': context.title,
-                        'process_name': context.process_name,
-                        'process_id': context.process_id,
-                        'trigger_source': context.trigger_source,
-                        'timestamp': context.timestamp,
-                        'class_name': context.class_name
-                    }
+            context = self.get_captured_context()
+            captured = self.captured_window_context
+            
+            cache = self._ctx_dict_cache
+            if (
+                cache is not None
+                and cache[0] == self._context_gen
+                and cache[1] is context
+                and cache[2] is captured
+            ):
+                return cache[3]
+            
+            ctx_dict = None
+            if context:
+                ctx_dict = dict(zip(_CONTEXT_DICT_KEYS, _extract_context_fields(context), strict=True))
             
             # Fallback: try captured_window_context
-            if hasattr(self, 'captured_window_context') and self.captured_window_context:
-                context = self.captured_window_context
-                if hasattr(context, 'window_info'):
-                    window_info = context.window_info
-                    return {
-                        'window_title': getattr(window_info, 'title', ''),
-                        'process_name': getattr(window_info, 'process_name', ''),
-                        'process_id': getattr(window_info, 'process_id', 0),
-                        'trigger_source': getattr(context, 'trigger_source', ''),
-                        'timestamp': getattr(context, 'timestamp', ''),
-                        'class_name': getattr(window_info, 'class_name', '')
-                    }
-            
-            return None
+            elif captured and hasattr(captured, 'window_info'):
+                window_info = captured.window_info
+                ctx_dict = {
+                    'window_title': getattr(window_info, 'title', ''),
+                    'process_name': getattr(window_info, 'process_name', ''),
+                    'process_id': getattr(window_info, 'process_id', 0),
+                    'trigger_source': getattr(captured, 'trigger_source', ''),
+                    'timestamp': getattr(captured, 'timestamp', ''),
+                    'class_name': getattr(window_info, 'class_name', '')
+                }
+            
+            if ctx_dict is not None:
+                ctx_dict = MappingProxyType(ctx_dict)
+            self._ctx_dict_cache = (self._context_gen, context, captured, ctx_dict)
+            return ctx_dict
             
         except Exception as e:
             logger.error(f"Error getting window context dict: {e}")
             return None
     
+    @_log_errors(default=False)
     def inject_text_to_application(self, text: str) -> bool:
         """Inject text to the active application (for backward compatibility)."""
-        try:
-            if self.system_service:
-                result = self.system_service.inject_text(text)
-                return result.success
-            return False
-            
-        except Exception as e:
-            logger.error(f" Failed to inject text: {e}")
-            return False
+        if self.system_service:
+            result = self.system_service.inject_text(text)
+            return result.success
+        return False
     
     def set_text(self, text: str):
         """Set text in the input area (for backward compatibility)."""
-        try:
-            input_text = self.ui_manager.get_component("input_text")
-            if input_text:
-                input_text.setPlainText(text)
-                logger.info(f" Text set: {text[:50]}...")
-            
-        except Exception as e:
-            logger.error(f" Failed to set text: {e}")
+        input_text = self._w_input_text
+        if input_text:
+            input_text.setPlainText(text)
+            logger.opt(lazy=True).info(" Text set: {}...", lambda: text[:50])
     
+    @_log_errors()
     def receive_external_input(self, text: str, button_number: int = 1, role_number: int = 1):
         """
         Receive text from an external source (e.g. HTTP POST) and display it
@@ -406,108 +449,119 @@ class ModularFloatingWindow(QWidget):
             button_number: Button identifier from the external client.
             role_number: Role identifier from the external client.
         """
-        try:
-            logger.info(f"External input received: {text[:80]}... button={button_number} role={role_number}")
-            
-            # Clear previous content
-            self.clear_content()
-            
-            # Set the text into the input field
-            self.set_text(text)
-            
-            # Auto-open the floating window if not visible
-            if not self.isVisible():
-                self.show_window()
-            else:
-                # Already visible — just ensure it's raised and focused
-                self.raise_()
-                self.activateWindow()
-                self._set_input_focus()
-            
-            logger.info("External input applied to floating window")
-            
-        except Exception as e:
-            logger.error(f"Failed to receive external input: {e}")
+        # Drop repeats (e.g. a retrying HTTP client) while they are still on screen
+        external_input = (text, button_number, role_number)
+        if (
+            external_input == self._last_external_input
+            and self.isVisible()
+            and self.get_input_text() == text
+        ):
+            logger.debug("Duplicate external input ignored")
+            return
+        self._last_external_input = external_input
+        
+        logger.opt(lazy=True).info(
+            "External input received: {}... button={} role={}",
+            lambda: text[:80], lambda: button_number, lambda: role_number,
+        )
+        
+        # The previous request's result would be discarded anyway
+        if self._current_request_id is not None and self.async_processor is not None:
+            self.async_processor.cancel_request(self._current_request_id)
+            self._current_request_id = None
+        
+        # Clear previous content
+        self.clear_content()
+        
+        # Set the text into the input field
+        self.set_text(text)
+        
+        # Auto-open the floating window if not visible
+        if not self.isVisible():
+            self.show_window()
+        else:
+            # Already visible — just ensure it's raised and focused
+            self.window_manager.bring_to_front()
+            self._set_input_focus()
+        
+        logger.info("External input applied to floating window")
     
+    @_log_errors()
     def update_settings(self, ui_settings: dict) -> None:
         """Update floating window settings dynamically"""
-        try:
-            logger.info(f"Updating floating window settings: {list(ui_settings.keys())}")
+        logger.info(f"Updating floating window settings: {list(ui_settings.keys())}")
 
-            # Update styling if relevant settings changed
-            styling_keys = {"transparency", "theme", "font_size"}
-            if any(key in ui_settings for key in styling_keys):
-                transparency = ui_settings.get("transparency", 0.9)
-                theme = ui_settings.get("theme", "dark")
-                font_size = ui_settings.get("font_size", 14)
-                
-                self.renderer.apply_styling(transparency, theme, font_size)
-                logger.info("Window styling updated")
+        incoming = ui_settings.keys()
 
-            # Update positioning if relevant settings changed
-            positioning_keys = {
-                "cursor_offset_x", "cursor_offset_y", 
-                "boundary_margin", "occlusion_threshold"
-            }
-            if any(key in ui_settings for key in positioning_keys):
-                self._configure_positioning()
-                logger.info("Window positioning updated")
+        # Update styling if relevant settings changed
+        if not incoming.isdisjoint(_STYLING_KEYS):
+            transparency = ui_settings.get("transparency", 0.9)
+            theme = ui_settings.get("theme", "dark")
+            font_size = ui_settings.get("font_size", 14)
+            
+            self.renderer.apply_styling(transparency, theme, font_size)
+            logger.info("Window styling updated")
 
-            logger.info("Floating window settings updated successfully")
+        # Update positioning if relevant settings changed
+        if not incoming.isdisjoint(_POSITIONING_KEYS):
+            self._configure_positioning()
+            logger.info("Window positioning updated")
 
-        except Exception as e:
-            logger.error(f"Error updating floating window settings: {e}")
+        logger.info("Floating window settings updated successfully")
     
+    @_log_errors()
     def _configure_positioning(self):
         """Configure positioning parameters from config"""
-        try:
-            from PySide6.QtCore import QPoint
-            
-            # Get positioning configuration
-            cursor_offset_x = int(self.config_manager.get("ui.cursor_offset_x", 10))
-            cursor_offset_y = int(self.config_manager.get("ui.cursor_offset_y", -10))
-            boundary_margin = int(self.config_manager.get("ui.boundary_margin", 20))
-            
-            # Apply configuration to positioning system
-            if hasattr(self.positioning, 'set_cursor_offset'):
-                self.positioning.set_cursor_offset(QPoint(cursor_offset_x, cursor_offset_y))
-            if hasattr(self.positioning, 'set_boundary_margin'):
-                self.positioning.set_boundary_margin(boundary_margin)
+        from PySide6.QtCore import QPoint
+        
+        # Get positioning configuration (re-read only after the config changed)
+        revision = self.config_manager.revision
+        cached = self._positioning_config_cache
+        if cached is not None and cached[0] == revision:
+            cursor_offset_x, cursor_offset_y, boundary_margin = cached[1]
+        else:
+            cursor_offset_x, cursor_offset_y, boundary_margin = map(int, self.config_manager.get_many(
+                ("ui.cursor_offset_x", "ui.cursor_offset_y", "ui.boundary_margin"),
+                (10, -10, 20),
+            ))
+            self._positioning_config_cache = (revision, (cursor_offset_x, cursor_offset_y, boundary_margin))
+        
+        # Apply configuration to positioning system
+        self.positioning.set_cursor_offset(QPoint(cursor_offset_x, cursor_offset_y))
+        self.positioning.set_boundary_margin(boundary_margin)
 
-            logger.info(f"Positioning configured - offset: ({cursor_offset_x}), margin: {boundary_margin}px")
-        except Exception as e:
-            logger.error(f"Error configuring positioning: {e}")
+        logger.info(f"Positioning configured - offset: ({cursor_offset_x}), margin: {boundary_margin}px")
     
     # Properties for backward compatibility
     @property
     def input_text(self):
         """Get input text widget (backward compatibility property)."""
-        return self.ui_manager.get_component("input_text")
+        return self._w_input_text
     
     @property
     def result_label(self):
         """Get result label widget (backward compatibility property)."""
-        return self.ui_manager.get_component("result_label")
+        return self._w_result_label
     
     @property
     def function_selector(self):
         """Get function selector widget (backward compatibility property)."""
-        return self.ui_manager.get_component("function_selector")
+        return self._w_function_selector
     
     @property
     def voice_button(self):
         """Get voice button widget (backward compatibility property)."""
-        return self.ui_manager.get_component("voice_button")
+        return self._w_voice_button
     
     @property
     def process_button(self):
-        """Get process button widget (backward compatibility property)."""
-        return self.ui_manager.get_component("process_button")
+        """Get process button widget, created on first access (backward compatibility property)."""
+        return self.ui_manager.hidden_controls()[1]
     
     @property
     def status_label(self):
-        """Get status label widget (backward compatibility property)."""
-        return self.ui_manager.get_component("status_label")
+        """Get status label widget, created on first access (backward compatibility property)."""
+        return self.ui_manager.hidden_controls()[0]
     
     @property
     def current_agent_type(self):
@@ -522,7 +576,7 @@ class ModularFloatingWindow(QWidget):
     @property
     def async_processor(self):
         """Get async processor (for backward compatibility)."""
-        return getattr(self, '_async_processor', None)
+        return self._async_processor
     
     @async_processor.setter
     def async_processor(self, value):
@@ -532,7 +586,7 @@ class ModularFloatingWindow(QWidget):
     @property
     def voice_service_v2(self):
         """Get voice service (for backward compatibility)."""
-        return getattr(self, 'voice_service', None)
+        return self.voice_service
     
     @voice_service_v2.setter
     def voice_service_v2(self, value):
@@ -540,13 +594,12 @@ class ModularFloatingWindow(QWidget):
         self.voice_service = value
     
     def _cleanup_active_timers(self):
-        """Clean up all active timers"""
+        """Stop all active timers (the window owns and deletes them)"""
         try:
+            self._wheel.clear()
             for timer in list(self._active_timers):
                 try:
-                    if timer and hasattr(timer, "stop"):
-                        timer.stop()
-                        timer.deleteLater()
+                    timer.stop()
                 except RuntimeError:
                     # Timer already deleted, ignore
                     pass
@@ -556,13 +609,22 @@ class ModularFloatingWindow(QWidget):
             pass
     
     def cleanup(self):
-        """Clean up all components."""
+        """
+        Clean up all components.
+        
+        Component QObjects are children of the window and are torn down by Qt
+        with it, so only threads, buffers and non-Qt services are handled here.
+        The window must not be used after cleanup.
+        """
         try:
             # Clean up active timers first
             self._cleanup_active_timers()
             
+            # Processing signal handlers must not reach the objects torn down below
+            self.processing.cleanup()
+            
             # Stop async processor
-            if hasattr(self, 'async_processor') and self.async_processor:
+            if self.async_processor is not None:
                 self.async_processor.stop_processing()
                 if not self.async_processor.wait(3000):  # Wait up to 3 seconds
                     self.async_processor.terminate()
@@ -570,35 +632,27 @@ class ModularFloatingWindow(QWidget):
                 self.async_processor = None
             
             # Cleanup buffers and managers
-            if hasattr(self, 'trigger_manager') and self.trigger_manager:
+            if self.trigger_manager is not None:
                 self.trigger_manager.cleanup()
                 self.trigger_manager = None
             
-            if hasattr(self, 'input_buffer') and self.input_buffer:
+            if self.input_buffer is not None:
                 self.input_buffer.cleanup()
                 self.input_buffer = None
             
-            if hasattr(self, 'output_buffer') and self.output_buffer:
+            if self.output_buffer is not None:
                 self.output_buffer.cleanup()
                 self.output_buffer = None
             
-            # Cleanup components in reverse order
-            if hasattr(self, 'positioning'):
-                self.positioning.cleanup()
-            
-            if hasattr(self, 'renderer'):
-                self.renderer.cleanup()
-            
-            if hasattr(self, 'ui_manager'):
-                self.ui_manager.cleanup()
-            
-            if hasattr(self, 'event_handler'):
-                self.event_handler.cleanup()
-            
             # Cleanup voice service
-            if hasattr(self, 'voice_service') and hasattr(self.voice_service, 'cleanup'):
+            if self.voice_service is not None:
                 self.voice_service.cleanup()
             
+            # Window manager, event handler, UI manager, renderer and positioning
+            # are deleted (filters removed, animations stopped) along with the window
+            self._cache_component_handles(clear=True)
+            self.deleteLater()
+            
             logger.info(" ModularFloatingWindow cleanup completed")
             
         except Exception as e:
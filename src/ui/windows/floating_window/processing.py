@@ -3,228 +3,365 @@ Processing Module
 Owns input/output buffers, trigger manager, and async processing lifecycle.
 """
 
+import functools
+import time
 from typing import Optional
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, Qt, QTimer
 from PySide6.QtWidgets import QWidget
 
 from src.utils.loguru_config import logger
 
+from ...widgets.input_buffer import InputBuffer
+from ...widgets.output_buffer import OutputBuffer
+from ...widgets.trigger_manager import TriggerManager
+from ...widgets.async_processor import AsyncProcessor, RequestPriority
 from .window_manager import WindowState
 
+# Streamed output updates are applied at most once per frame (~60 Hz)
+_OUTPUT_FLUSH_INTERVAL_S = 0.016
+
+# Status label text per output buffer state (anything else shows "Ready")
+_OUTPUT_STATUS_TEXT = {
+    "processing": "Processing...",
+    "success": "Ready",
+    "error": "Error",
+    "cancelled": "Cancelled",
+}
+
+
+def _safe_slot(label: str):
+    """Log and swallow exceptions raised by a signal handler so they never reach Qt."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("{}: {}", label, e)
+        return wrapper
+    return decorator
+
+
+class _CallEvent(QEvent):
+    """Posted event carrying a handler call for _PriorityDispatcher."""
+
+    TYPE = QEvent.Type(QEvent.registerEventType())
+
+    def __init__(self, handler, args: tuple):
+        super().__init__(_CallEvent.TYPE)
+        self.handler = handler
+        self.args = args
+
+
+class _PriorityDispatcher(QObject):
+    """Runs worker-thread signal handlers on the GUI thread ahead of normal-priority events."""
+
+    def post(self, handler, *args):
+        """Queue handler(*args) for the GUI thread with high event priority (thread-safe)."""
+        QCoreApplication.postEvent(self, _CallEvent(handler, args), Qt.HighEventPriority.value)
+
+    def event(self, event):
+        if event.type() == _CallEvent.TYPE:
+            event.handler(*event.args)
+            return True
+        return super().event(event)
+
 
 class ProcessingModule:
     """
     Encapsulates text processing flow: buffering, debouncing triggers, and async execution.
     """
 
+    # (current state, input event) -> next state; "empty" means the input was
+    # cleared with no result shown. Heights follow via the state_changed handler.
+    _INPUT_TRANSITIONS = {
+        (WindowState.INITIAL, "nonempty"): WindowState.INPUT,
+        (WindowState.INPUT, "empty"): WindowState.INITIAL,
+    }
+
+    # Cached widget handles refreshed by _on_component_created
+    _CACHED_COMPONENTS = {
+        "input_text": "_input_text",
+        "function_selector": "_function_selector",
+        "status_label": "_status_label",
+    }
+
     def __init__(self, window: QWidget):
         self.window = window
 
+        # Latest streamed output not yet applied, and whether a flush is queued
+        self._pending_output: Optional[str] = None
+        self._flush_scheduled = False
+        self._last_output_flush = 0.0
+
+        # Collaborators resolved once in setup_buffers_and_processors so the
+        # signal handlers below test a local reference instead of probing the window
+        self._input_buffer = None
+        self._output_buffer = None
+        self._trigger_manager = None
+        self._async_processor = None
+        self._input_text = None
+        self._function_selector = None
+        self._status_label = None
+        # Last status text, applied when the lazily created status label appears
+        self._status_text = "Ready"
+
     def setup_buffers_and_processors(self):
         """Setup input/output buffers and async processors (migrated)."""
         try:
-            from ...widgets.input_buffer import InputBuffer
-            from ...widgets.output_buffer import OutputBuffer
-            from ...widgets.trigger_manager import TriggerManager
-            from ...widgets.async_processor import AsyncProcessor
+            ui_manager = self.window.ui_manager
+            self._function_selector = ui_manager.get_component("function_selector")
+            self._status_label = ui_manager.get_component("status_label")
+            ui_manager.component_created.connect(self._on_component_created)
 
             # Setup input buffer
-            input_text = self.window.ui_manager.get_component("input_text")
+            input_text = self._input_text = ui_manager.get_component("input_text")
             if input_text:
-                self.window.input_buffer = InputBuffer(input_text)
-                self.window.input_buffer.text_changed.connect(self.on_input_buffer_changed)
+                self._input_buffer = self.window.input_buffer = InputBuffer(input_text)
+                self._input_buffer.content_changed.connect(self.on_input_buffer_changed)
                 logger.info("Input buffer initialized (processing)")
 
             # Setup output buffer
-            result_label = self.window.ui_manager.get_component("result_label")
+            result_label = ui_manager.get_component("result_label")
             if result_label:
-                self.window.output_buffer = OutputBuffer(result_label)
-                self.window.output_buffer.content_updated.connect(self.on_output_updated)
-                self.window.output_buffer.state_changed.connect(self.on_output_state_changed)
+                self._output_buffer = self.window.output_buffer = OutputBuffer(result_label)
+                self._output_buffer.content_updated.connect(self.on_output_updated)
+                self._output_buffer.state_changed.connect(self.on_output_state_changed)
                 logger.info("Output buffer initialized (processing)")
 
             # Setup trigger manager
             debounce_ms = self.window.config_manager.get("processing.debounce_ms", 800)
-            self.window.trigger_manager = TriggerManager(debounce_ms)
-            self.window.trigger_manager.processing_triggered.connect(self.on_processing_triggered)
-            self.window.trigger_manager.trigger_cancelled.connect(self.on_trigger_cancelled)
+            self._trigger_manager = self.window.trigger_manager = TriggerManager(debounce_ms)
+            self._trigger_manager.processing_triggered.connect(self.on_processing_triggered)
+            self._trigger_manager.trigger_cancelled.connect(self.on_trigger_cancelled)
             logger.info(f" Trigger manager initialized with {debounce_ms}ms debounce (processing)")
 
             # Setup async processor
+            # Processor signals are emitted on its worker thread and posted straight
+            # to the GUI thread at high priority, so results are not queued behind
+            # paint/layout events. All four share the path to keep their order.
             async_processor = AsyncProcessor(self.window.ai_service_manager)
-            async_processor.processing_started.connect(self.on_async_processing_started)
-            async_processor.processing_completed.connect(self.on_async_processing_completed)
-            async_processor.processing_failed.connect(self.on_async_processing_failed)
-            async_processor.processing_cancelled.connect(self.on_async_processing_cancelled)
+            dispatcher = _PriorityDispatcher(self.window)
+            for signal, handler in (
+                (async_processor.processing_started, self.on_async_processing_started),
+                (async_processor.processing_completed, self.on_async_processing_completed),
+                (async_processor.processing_failed, self.on_async_processing_failed),
+                (async_processor.processing_cancelled, self.on_async_processing_cancelled),
+            ):
+                signal.connect(
+                    lambda *args, handler=handler: dispatcher.post(handler, *args),
+                    Qt.DirectConnection,
+                )
             async_processor.start()
-            self.window.async_processor = async_processor  # use property for backward compat
+            self._async_processor = self.window.async_processor = async_processor  # use property for backward compat
             logger.info("Async processor initialized and started (processing)")
 
         except Exception as e:
             logger.error(f" Failed to setup buffers and processors (processing): {e}")
 
+    def _on_component_created(self, name: str, widget: QWidget):
+        """Re-point a cached widget handle when ui_manager (re)creates that component."""
+        attr = self._CACHED_COMPONENTS.get(name)
+        if attr is not None:
+            setattr(self, attr, widget)
+        if name == "status_label":
+            widget.setText(self._status_text)
+
     # Buffer and processor event handlers
-    def on_input_buffer_changed(self, text: str):
-        """Handle input buffer text changes (migrated)."""
-        try:
-            # Skip processing if we're already processing to prevent duplicate triggers
-            if hasattr(self.window, '_is_processing') and self.window._is_processing:
-                logger.info("Processing in progress")
-                return
-
-            # Update window state based on content
-            if text.strip():
-                if self.window.window_manager.current_state == WindowState.INITIAL:
-                    self.window.window_manager.set_state(WindowState.INPUT)
-                    self.window._animate_to_height(184) if not hasattr(self.window, 'interaction') else self.window.interaction.animate_to_height(184)
+    @_safe_slot("Error handling input buffer change (processing)")
+    def on_input_buffer_changed(self, has_text: bool):
+        """Handle input buffer text changes; the text is read only when it is forwarded (migrated)."""
+        # Skip processing if we're already processing to prevent duplicate triggers
+        if self.window._is_processing:
+            # Fires for every settled edit while a result is pending
+            logger.debug("Processing in progress")
+            return
+
+        # Update window state based on content
+        event = "nonempty" if has_text else (None if self.window.processed_text else "empty")
+        window_manager = self.window.window_manager
+        new_state = self._INPUT_TRANSITIONS.get((window_manager.current_state, event))
+        if new_state is not None:
+            window_manager.set_state(new_state)
+
+        # Trigger processing via trigger manager only if text is not empty
+        trigger_manager = self._trigger_manager
+        if trigger_manager is not None:
+            if has_text:
+                trigger_manager.on_text_changed(
+                    self._input_buffer.get_content(), self.window.current_agent_type
+                )
             else:
-                if self.window.window_manager.current_state == WindowState.INPUT and not self.window.processed_text:
-                    self.window.window_manager.set_state(WindowState.INITIAL)
-                    self.window._animate_to_height(120) if not hasattr(self.window, 'interaction') else self.window.interaction.animate_to_height(120)
-
-            # Trigger processing via trigger manager only if text is not empty
-            if hasattr(self.window, 'trigger_manager') and text.strip():
-                self.window.trigger_manager.on_text_changed(text, self.window.current_agent_type)
-
-        except Exception as e:
-            logger.error(f"Error handling input buffer change (processing): {e}")
+                # Text deleted: nothing left for a trailing-edge trigger
+                trigger_manager.cancel_pending_triggers()
 
+    @_safe_slot("Error handling agent selection change (processing)")
     def on_agent_selection_changed(self, index: int):
         """Handle agent selection changes from function selector (migrated)."""
-        try:
-            function_selector = self.window.ui_manager.get_component("function_selector")
-            if function_selector and index >= 0:
-                agent_type = function_selector.itemData(index)
-                if agent_type:
-                    self.window._current_agent_type = agent_type
-                    logger.info(f"Agent selection changed to: {agent_type}")
-
-                    input_text = self.window.ui_manager.get_component("input_text")
-                    if input_text and hasattr(self.window, 'trigger_manager'):
-                        current_text = input_text.toPlainText().strip()
-                        if current_text:
-                            self.window.trigger_manager.on_text_changed(current_text, agent_type)
-
-        except Exception as e:
-            logger.error(f"Error handling agent selection change (processing): {e}")
+        function_selector = self._function_selector
+        if function_selector and index >= 0:
+            agent_type = function_selector.itemData(index)
+            if agent_type:
+                self.window._current_agent_type = agent_type
+                logger.info("Agent selection changed to: {}", agent_type)
+
+                input_text = self._input_text
+                if input_text and self._trigger_manager is not None:
+                    current_text = input_text.toPlainText().strip()
+                    if current_text:
+                        self._trigger_manager.on_text_changed(current_text, agent_type)
 
     def on_output_updated(self, content: str):
+        """Queue an output buffer update; bursts collapse into one flush per event-loop turn."""
+        # Re-emits of the result already on screen need no flush at all
+        # (processed_text is reset whenever the window content is cleared)
+        if (
+            not self._flush_scheduled
+            and content == self.window.processed_text
+            and self.window.window_manager.current_state == WindowState.COMPLETE
+        ):
+            return
+        self._pending_output = content
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_output)
+
+    def _flush_output(self):
+        """Apply the latest queued output, deferring if the previous flush was under a frame ago."""
+        wait = _OUTPUT_FLUSH_INTERVAL_S - (time.perf_counter() - self._last_output_flush)
+        if wait > 0:
+            QTimer.singleShot(int(wait * 1000) + 1, self._flush_output)
+            return
+
+        self._flush_scheduled = False
+        content, self._pending_output = self._pending_output, None
+        self._last_output_flush = time.perf_counter()
+        if content is not None:
+            self._apply_output(content)
+
+    @_safe_slot("Error handling output update (processing)")
+    def _apply_output(self, content: str):
         """Handle output buffer content updates (migrated)."""
-        try:
-            self.window.processed_text = content
+        self.window.processed_text = content
 
-            if content.strip():
-                self.window.window_manager.set_state(WindowState.COMPLETE)
-                self.window._animate_to_height(232) if not hasattr(self.window, 'interaction') else self.window.interaction.animate_to_height(232)
-
-        except Exception as e:
-            logger.error(f"Error handling output update (processing): {e}")
+        # Later chunks of the same result must not restart the height animation
+        # (set_state animates to the COMPLETE height via the state_changed handler)
+        if content and not content.isspace() and self.window.window_manager.current_state != WindowState.COMPLETE:
+            self.window.window_manager.set_state(WindowState.COMPLETE)
 
+    @_safe_slot("Error handling output state change (processing)")
     def on_output_state_changed(self, state: str):
         """Handle output buffer state changes (migrated)."""
-        try:
-            status_label = self.window.ui_manager.get_component("status_label")
-            if status_label:
-                if state == "processing":
-                    status_label.setText("Processing...")
-                elif state == "success":
-                    status_label.setText("Ready")
-                elif state == "error":
-                    status_label.setText("Error")
-                elif state == "cancelled":
-                    status_label.setText("Cancelled")
-                else:
-                    status_label.setText("Ready")
-
-        except Exception as e:
-            logger.error(f"Error handling output state change (processing): {e}")
+        text = self._status_text = _OUTPUT_STATUS_TEXT.get(state, "Ready")
+        status_label = self._status_label
+        if status_label and status_label.text() != text:
+            status_label.setText(text)
 
+    @_safe_slot("Error handling processing trigger (processing)")
     def on_processing_triggered(self, trigger_type: str, text: str, agent_name: str):
         """Handle processing trigger from trigger manager (migrated)."""
-        try:
-            if hasattr(self.window, 'async_processor') and self.window.async_processor:
-                from src.ui.widgets.async_processor import RequestPriority
-
-                priority = RequestPriority.IMMEDIATE if trigger_type == "enter_key" else RequestPriority.NORMAL
-                window_context = self.window._get_window_context_dict()
-
-                request_id = self.window.async_processor.submit_request(
-                    text,
-                    agent_name,
-                    priority,
-                    window_context=window_context,
+        async_processor = self._async_processor
+        if async_processor is not None:
+            priority = RequestPriority.IMMEDIATE if trigger_type == "enter_key" else RequestPriority.NORMAL
+            window_context = self.window._get_window_context_dict()
+
+            request_id = async_processor.submit_request(
+                text,
+                agent_name,
+                priority,
+                window_context=window_context,
+            )
+            self.window._current_request_id = request_id
+
+            if window_context:
+                logger.opt(lazy=True).info(
+                    " Processing queued: {} trigger with context: {}",
+                    lambda: trigger_type, lambda: window_context.get('window_title', 'Unknown'),
                 )
-
-                if window_context:
-                    logger.info(
-                        f" Processing queued: {trigger_type} trigger with context: {window_context.get('window_title', 'Unknown')}"
-                    )
-                else:
-                    logger.info(f" Processing queued: {trigger_type} trigger")
-
-        except Exception as e:
-            logger.error(f" Error handling processing trigger (processing): {e}")
+            else:
+                logger.info(" Processing queued: {} trigger", trigger_type)
 
     def on_trigger_cancelled(self, trigger_type: str):
         """Handle trigger cancellation (migrated)."""
-        logger.info(f" Trigger cancelled: {trigger_type}")
+        logger.info(" Trigger cancelled: {}", trigger_type)
+
+    def _release_request(self, request_id: int) -> bool:
+        """Forget request_id as the window's in-flight request once it has finished.
 
+        Returns False for a stale request (cancelled or superseded after its
+        result was already posted), whose result must not reach the output.
+        """
+        if self.window._current_request_id != request_id:
+            return False
+        self.window._current_request_id = None
+        return True
+
+    @_safe_slot("Error handling async processing start (processing)")
     def on_async_processing_started(self, request_id: int, agent_name: str):
         """Handle async processing start (migrated)."""
-        try:
-            if hasattr(self.window, 'trigger_manager'):
-                self.window.trigger_manager.set_processing_state(True)
+        if self._trigger_manager is not None:
+            self._trigger_manager.set_processing_state(True)
 
-            if hasattr(self.window, 'output_buffer') and self.window.output_buffer:
-                self.window.output_buffer.start_processing(agent_name)
+        if self._output_buffer is not None:
+            self._output_buffer.start_processing(agent_name)
 
-            logger.info(f"Async processing started: request_id={request_id}")
-
-        except Exception as e:
-            logger.error(f"Error handling async processing start (processing): {e}")
+        logger.info("Async processing started: request_id={}", request_id)
 
+    @_safe_slot("Error handling async processing completion (processing)")
     def on_async_processing_completed(self, request_id: int, agent_name: str, result: str):
         """Handle async processing completion (migrated)."""
-        try:
-            if hasattr(self.window, 'trigger_manager'):
-                self.window.trigger_manager.set_processing_state(False)
+        is_current = self._release_request(request_id)
+        if self._trigger_manager is not None:
+            self._trigger_manager.set_processing_state(False)
 
-            if hasattr(self.window, 'output_buffer') and self.window.output_buffer:
-                self.window.output_buffer.complete_processing(result)
+        if not is_current:
+            logger.info("Discarding stale result: request_id={}", request_id)
+            return
 
-            if hasattr(self.window, 'input_buffer') and self.window.input_buffer:
-                self.window.input_buffer.mark_processed()
+        if self._output_buffer is not None:
+            self._output_buffer.complete_processing(result)
 
-            self.window.text_processed.emit(result)
+        if self._input_buffer is not None:
+            self._input_buffer.mark_processed()
 
-            logger.info(f"Async processing completed: request_id={request_id}")
+        self.window.text_processed.emit(result)
 
-        except Exception as e:
-            logger.error(f"Error handling async processing completion (processing): {e}")
+        logger.info("Async processing completed: request_id={}", request_id)
 
+    @_safe_slot("Error handling async processing failure (processing)")
     def on_async_processing_failed(self, request_id: int, agent_name: str, error: str):
         """Handle async processing failure (migrated)."""
-        try:
-            if hasattr(self.window, 'trigger_manager'):
-                self.window.trigger_manager.set_processing_state(False)
+        is_current = self._release_request(request_id)
+        if self._trigger_manager is not None:
+            self._trigger_manager.set_processing_state(False)
 
-            if hasattr(self.window, 'output_buffer') and self.window.output_buffer:
-                self.window.output_buffer.error_processing(error)
+        if not is_current:
+            logger.info("Ignoring failure of stale request: request_id={}", request_id)
+            return
 
-            logger.error(f"Async processing failed: request_id={request_id}")
+        if self._output_buffer is not None:
+            self._output_buffer.error_processing(error)
 
-        except Exception as e:
-            logger.error(f"Error handling async processing failure (processing): {e}")
+        logger.error("Async processing failed: request_id={}", request_id)
 
+    @_safe_slot("Error handling async processing cancellation (processing)")
     def on_async_processing_cancelled(self, request_id: int, agent_name: str):
         """Handle async processing cancellation (migrated)."""
-        try:
-            if hasattr(self.window, 'trigger_manager'):
-                self.window.trigger_manager.set_processing_state(False)
-
-            if hasattr(self.window, 'output_buffer') and self.window.output_buffer:
-                self.window.output_buffer.cancel_processing()
-
-            logger.info(f"Async processing cancelled: request_id={request_id}")
-
-        except Exception as e:
-            logger.error(f"Error handling async processing cancellation (processing): {e}")
\ No newline at end of file
+        self._release_request(request_id)
+        if self._trigger_manager is not None:
+            self._trigger_manager.set_processing_state(False)
+
+        if self._output_buffer is not None:
+            self._output_buffer.cancel_processing()
+
+        logger.info("Async processing cancelled: request_id={}", request_id)
+
+    def cleanup(self):
+        """Drop cached collaborator references; the window cleans the objects up."""
+        self._input_buffer = None
+        self._output_buffer = None
+        self._trigger_manager = None
+        self._async_processor = None
+        self._input_text = None
+        self._function_selector = None
+        self._status_label = None
@@ -3,14 +3,21 @@ Window Renderer Module - Extracted from FloatingWindow
 Handles Qt native rendering operations, animation handling, and resource management.
 """
 
-from typing import Optional, Dict, Any
-from PySide6.QtCore import QObject, Signal, QPropertyAnimation, QEasingCurve
+from enum import IntEnum
+from typing import Optional, Dict, Any, Union
+from PySide6.QtCore import QObject, Signal, QPropertyAnimation, QEasingCurve, QTimer
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QWidget
 
 from src.ui.rendering.qt_renderer import QtRenderer
 from src.utils.loguru_config import logger, get_logger
 
 
+class AnimationSlot(IntEnum):
+    """Index of each window animation in WindowRenderer.animations."""
+    HEIGHT = 0
+
+
 class WindowRenderer(QObject):
     """Manages window rendering, animations, and visual effects using Qt native capabilities."""
     
@@ -20,8 +27,12 @@ class WindowRenderer(QObject):
     animation_finished = Signal(str)  # animation_name
     theme_changed = Signal(str)  # theme_name
     
+    # Background color per theme; "auto" and unknown themes use dark
+    _LIGHT_THEME_COLOR = QColor(255, 255, 255)  # White
+    _DARK_THEME_COLOR = QColor(30, 30, 30)  # Dark gray
+    
     def __init__(self, target_widget: QWidget, config_manager):
-        super().__init__()
+        super().__init__(target_widget)
         self.target_widget = target_widget
         self.config_manager = config_manager
         self.logger = get_logger(__name__)
@@ -30,15 +41,21 @@ class WindowRenderer(QObject):
         self.qt_renderer: Optional[QtRenderer] = None
         
         # Animation system
-        self.animations: Dict[str, QPropertyAnimation] = {}
+        self.animations: list[Optional[QPropertyAnimation]] = [None] * len(AnimationSlot)
         self.height_animation: Optional[QPropertyAnimation] = None
         
+        # Latest animate_to_height target, applied once per frame
+        self._pending_target: Optional[int] = None
+        self._coalesce_timer: Optional[QTimer] = None
+        
         # Window heights for three-state system
         self.window_heights = {
             "initial": 120,  # 增加8px以适应更高的输入框
             "input": 184,    # 增加8px以适应更高的输入框
             "complete": 232  # 增加8px以适应更高的输入框
         }
+        # animation_started names for the state heights, built once
+        self._height_animation_names = {h: f"height_to_{h}" for h in self.window_heights.values()}
         
         # Initialize renderer and animations
         self._init_qt_renderer()
@@ -50,6 +67,7 @@ class WindowRenderer(QObject):
         """Initialize Qt renderer for native rendering."""
         try:
             self.qt_renderer = QtRenderer(self.target_widget)
+            self.qt_renderer.setParent(self)
             
             if self.qt_renderer.is_initialized:
                 logger.info("Qt renderer initialized successfully")
@@ -68,12 +86,18 @@ class WindowRenderer(QObject):
         """Setup animation system for window state transitions."""
         try:
             # Height animation for three-state window system
-            self.height_animation = QPropertyAnimation(self.target_widget, b"maximumHeight")
+            self.height_animation = QPropertyAnimation(self.target_widget, b"maximumHeight", self)
             self.height_animation.setDuration(300)  # 300ms animation
             self.height_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
             self.height_animation.finished.connect(self._on_height_animation_finished)
             
-            self.animations["height"] = self.height_animation
+            self.animations[AnimationSlot.HEIGHT] = self.height_animation
+            
+            # Coalesce bursts of animate_to_height calls into one restart per frame
+            self._coalesce_timer = QTimer(self)
+            self._coalesce_timer.setSingleShot(True)
+            self._coalesce_timer.setInterval(16)
+            self._coalesce_timer.timeout.connect(self._apply_pending_height)
             
             logger.info("Animation system setup completed")
             
@@ -100,42 +124,73 @@ class WindowRenderer(QObject):
                 logger.error(f"Unknown window state: {state}")
                 return
             
-            if self.height_animation and target_height:
-                # Clear previous size constraints
-                current_height = self.target_widget.height()
-                min_height = min(current_height, target_height)
-                max_height = max(current_height, target_height)
-                self.target_widget.setMinimumHeight(min_height)
-                self.target_widget.setMaximumHeight(max_height)
-                
-                # Set animation values
-                self.height_animation.setStartValue(current_height)
-                self.height_animation.setEndValue(target_height)
-                self.height_animation.start()
-                
-                self.animation_started.emit(f"height_to_{target_height}")
+            if target_height:
+                # Reuse the single height animation through the coalescing path
+                self.animate_to_height(target_height)
                 logger.info(f"Animating to height: {target_height}px (from state: {state})")
             
         except Exception as e:
             logger.error(f"Failed to animate to state {state}: {e}")
     
     def animate_to_height(self, target_height: int) -> None:
-        """Directly animate to a specific height."""
+        """Directly animate to a specific height (applied on the next frame; the last target wins)."""
+        if self._coalesce_timer is None:
+            self._start_height_animation(target_height)
+            return
+        
+        animation = self.height_animation
+        if (
+            self.target_widget.height() == target_height
+            and (animation is None or animation.state() != QPropertyAnimation.State.Running)
+        ):
+            # Already there; a target queued earlier in this frame is now stale
+            self._pending_target = None
+            self._coalesce_timer.stop()
+            return
+        
+        if self._pending_target == target_height:
+            return
+        self._pending_target = target_height
+        self._coalesce_timer.start()
+    
+    def _apply_pending_height(self) -> None:
+        """Start the height animation for the latest coalesced target."""
+        target_height, self._pending_target = self._pending_target, None
+        if target_height is None:
+            return
+        
+        animation = self.height_animation
+        if (
+            animation
+            and animation.state() == QPropertyAnimation.State.Running
+            and animation.endValue() == target_height
+        ):
+            # Already heading there
+            return
+        
+        self._start_height_animation(target_height)
+    
+    def _start_height_animation(self, target_height: int) -> None:
+        """Restart the height animation from the current height to target_height."""
         try:
             if self.height_animation:
-                # Clear previous size constraints
-                current_height = self.target_widget.height()
-                min_height = min(current_height, target_height)
-                max_height = max(current_height, target_height)
-                self.target_widget.setMinimumHeight(min_height)
-                self.target_widget.setMaximumHeight(max_height)
+                # Clear previous size constraints as one update
+                target_widget = self.target_widget
+                current_height = target_widget.height()
+                target_widget.setUpdatesEnabled(False)
+                try:
+                    target_widget.setMinimumHeight(min(current_height, target_height))
+                    target_widget.setMaximumHeight(max(current_height, target_height))
+                finally:
+                    target_widget.setUpdatesEnabled(True)
                 
                 # Set animation values
                 self.height_animation.setStartValue(current_height)
                 self.height_animation.setEndValue(target_height)
                 self.height_animation.start()
                 
-                self.animation_started.emit(f"height_to_{target_height}")
+                name = self._height_animation_names.get(target_height) or f"height_to_{target_height}"
+                self.animation_started.emit(name)
                 logger.info(f"Animating directly to height: {target_height}px")
             
         except Exception as e:
@@ -182,14 +237,14 @@ class WindowRenderer(QObject):
         except Exception as e:
             logger.error(f"Error applying Qt styling: {e}")
 
-    def _get_theme_color(self, theme: str) -> 'QColor':
-        """Get theme-appropriate background color."""
-        from PySide6.QtGui import QColor
-        
-        if theme == "light":
-            return QColor(255, 255, 255)  # White
-        else:  # dark or auto
-            return QColor(30, 30, 30)  # Dark gray
+    def set_child_stylesheet(self, stylesheet: str) -> None:
+        """Set child widget rules that every styling pass keeps on the window."""
+        if self.qt_renderer:
+            self.qt_renderer.child_stylesheet = stylesheet
+
+    def _get_theme_color(self, theme: str) -> QColor:
+        """Get theme-appropriate background color (shared instance, do not modify)."""
+        return self._LIGHT_THEME_COLOR if theme == "light" else self._DARK_THEME_COLOR
     
     def apply_styling(self, transparency: float, theme: str, font_size: int) -> None:
         """Apply styling using Qt native renderer."""
@@ -237,9 +292,13 @@ class WindowRenderer(QObject):
         except Exception as e:
             logger.error(f"Failed to set hardware acceleration: {e}")
     
-    def get_animation(self, name: str) -> Optional[QPropertyAnimation]:
-        """Get animation by name."""
-        return self.animations.get(name)
+    def get_animation(self, slot: Union[AnimationSlot, str]) -> Optional[QPropertyAnimation]:
+        """Get animation by slot (or by its lowercase name, e.g. "height")."""
+        if isinstance(slot, str):
+            slot = AnimationSlot.__members__.get(slot.upper())
+            if slot is None:
+                return None
+        return self.animations[slot]
     
     def is_qt_renderer_available(self) -> bool:
         """Check if Qt renderer is available and initialized."""
@@ -250,7 +309,7 @@ class WindowRenderer(QObject):
         return {
             "qt_renderer_available": self.is_qt_renderer_available(),
             "renderer_type": "Qt Native",
-            "animations_count": len(self.animations),
+            "animations_count": sum(animation is not None for animation in self.animations),
             "window_heights": self.window_heights
         }
     
@@ -258,11 +317,14 @@ class WindowRenderer(QObject):
         """Clean up renderer resources."""
         try:
             # Stop all animations
-            for animation in self.animations.values():
-                if animation.state() == QPropertyAnimation.State.Running:
+            if self._coalesce_timer:
+                self._coalesce_timer.stop()
+            self._pending_target = None
+            for animation in self.animations:
+                if animation is not None and animation.state() == QPropertyAnimation.State.Running:
                     animation.stop()
             
-            self.animations.clear()
+            self.animations = [None] * len(AnimationSlot)
             
             # Cleanup Qt renderer
             if self.qt_renderer:
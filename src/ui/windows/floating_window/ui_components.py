@@ -3,7 +3,8 @@ UI Components Manager Module - Extracted from FloatingWindow
 Handles UI element creation, layout management, and theme application.
 """
 
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 from PySide6.QtCore import QObject, Signal, Qt
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
@@ -13,6 +14,201 @@ from PySide6.QtWidgets import (
 from src.utils.loguru_config import logger, get_logger
 
 
+# Styles for every floating window component, installed once on the window
+# (one stylesheet parse) and matched by objectName. Rules scoped to
+# #resultContainer replace the container's former own sheet, so the upload
+# button rule carries both ids to stay more specific.
+COMPONENT_STYLESHEET = """
+    QLabel#aiIcon {
+        background-color: rgba(59, 130, 246, 0.8);
+        border-radius: 16px;
+        border: 2px solid rgba(255, 255, 255, 0.2);
+    }
+    QComboBox#functionSelector {
+        background-color: rgba(75, 85, 99, 0.6);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 16px;
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+        padding: 0px;
+        text-align: center;
+    }
+    QComboBox#functionSelector:hover {
+        background-color: rgba(75, 85, 99, 0.8);
+    }
+    QComboBox#functionSelector:focus {
+        background-color: rgba(59, 130, 246, 0.8);
+        border: 1px solid rgba(59, 130, 246, 1.0);
+    }
+    QComboBox#functionSelector::drop-down {
+        border: none;
+        width: 12px;
+    }
+    QComboBox#functionSelector::down-arrow {
+        image: none;
+        border-left: 3px solid transparent;
+        border-right: 3px solid transparent;
+        border-top: 3px solid white;
+        margin-right: 4px;
+    }
+    QComboBox#functionSelector QAbstractItemView {
+        background-color: rgba(75, 85, 99, 0.95);
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 8px;
+        color: white;
+        selection-background-color: rgba(59, 130, 246, 0.8);
+        padding: 4px;
+        min-width: 180px;
+    }
+    QComboBox#functionSelector QAbstractItemView::item {
+        padding: 6px 12px;
+        border-radius: 4px;
+        margin: 1px;
+    }
+    QComboBox#functionSelector QAbstractItemView::item:hover {
+        background-color: rgba(59, 130, 246, 0.6);
+    }
+    QPushButton#clearButton {
+        background-color: rgba(239, 68, 68, 0.6);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 16px;
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton#clearButton:hover {
+        background-color: rgba(239, 68, 68, 0.8);
+    }
+    QPushButton#clearButton:pressed {
+        background-color: rgba(239, 68, 68, 1.0);
+    }
+    QPushButton#voiceButton {
+        background-color: rgba(75, 85, 99, 0.6);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 16px;
+        color: white;
+        font-size: 14px;
+    }
+    QPushButton#voiceButton:hover {
+        background-color: rgba(75, 85, 99, 0.8);
+    }
+    QTextEdit#inputText {
+        background-color: rgba(31, 41, 55, 0.9);
+        border: 2px solid rgba(59, 130, 246, 0.3);
+        border-radius: 16px;
+        padding: 8px 16px;
+        color: white;
+        font-size: 14px;
+        line-height: 1.4;
+        selection-background-color: rgba(59, 130, 246, 0.3);
+    }
+    QTextEdit#inputText:focus {
+        border-color: rgba(59, 130, 246, 0.6);
+        background-color: rgba(31, 41, 55, 1.0);
+    }
+    QFrame#resultSeparator { border: 1px solid rgba(255,255,255,0.06); margin-top: 4px; margin-bottom: 4px; }
+    QWidget#resultContainer, QWidget#resultContainer QWidget {
+        background-color: rgba(31, 41, 55, 0.8);
+        border: 1px solid rgba(75, 85, 99, 0.3);
+        border-radius: 8px;
+    }
+    QWidget#resultContainer QLabel {
+        background-color: transparent;
+        border: none;
+        color: white;
+        font-size: 14px;
+        selection-background-color: rgba(59, 130, 246, 0.35);
+    }
+    QWidget#resultContainer QPushButton#uploadButton {
+        background-color: rgba(59, 130, 246, 0.8);
+        border: 1px solid rgba(59, 130, 246, 1.0);
+        border-radius: 16px;
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QWidget#resultContainer QPushButton#uploadButton:hover {
+        background-color: rgba(59, 130, 246, 1.0);
+    }
+    QWidget#resultContainer QPushButton#uploadButton:pressed {
+        background-color: rgba(37, 99, 235, 1.0);
+    }
+"""
+
+
+@lru_cache(maxsize=16)
+def _build_theme_qss(bg_color: str, text_color: str, border_color: str,
+                     cursor_color: str) -> Tuple[str, str, str, str, str]:
+    """Build the (window, input, result, button, status) theme sheets, cached per color set."""
+    # Window style
+    window_style = f"""
+    QWidget {{
+        background-color: {bg_color};
+        border-radius: 12px;
+        color: {text_color};
+    }}
+    """
+
+    # Input text style
+    input_style = f"""
+    QTextEdit {{
+        background-color: rgba(0, 0, 0, 0.3);
+        border: 1px solid {border_color};
+        border-radius: 8px;
+        padding: 8px;
+        color: {text_color};
+        selection-background-color: rgba(255, 255, 255, 0.3);
+    }}
+    QTextEdit:focus {{
+        border: 2px solid {cursor_color};
+    }}
+    """
+
+    # Result label style
+    result_style = f"""
+    QLabel {{
+        background-color: rgba(0, 0, 0, 0.2);
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 6px;
+        padding: 8px;
+        color: {text_color};
+    }}
+    """
+
+    # Button style
+    button_style = f"""
+    QPushButton {{
+        background-color: rgba(0, 0, 0, 0.4);
+        border: 1px solid {border_color};
+        border-radius: 6px;
+        padding: 6px 12px;
+        color: {text_color};
+    }}
+    QPushButton:hover {{
+        background-color: rgba(255, 255, 255, 0.1);
+    }}
+    QPushButton:pressed {{
+        background-color: rgba(255, 255, 255, 0.2);
+    }}
+    QPushButton:disabled {{
+        background-color: rgba(0, 0, 0, 0.2);
+        color: rgba(255, 255, 255, 0.5);
+    }}
+    """
+
+    # Status label style
+    status_style = f"""
+    QLabel {{
+        color: {text_color};
+        font-size: 12px;
+        padding: 4px;
+    }}
+    """
+    
+    return window_style, input_style, result_style, button_style, status_style
+
+
 class UIComponentManager(QObject):
     """Manages UI component creation, layout, and styling for the floating window."""
     
@@ -22,7 +218,7 @@ class UIComponentManager(QObject):
     theme_applied = Signal(str)  # theme_name
     
     def __init__(self, parent_widget: QWidget, config_manager):
-        super().__init__()
+        super().__init__(parent_widget)
         self.parent_widget = parent_widget
         self.config_manager = config_manager
         self.logger = get_logger()
@@ -31,6 +227,9 @@ class UIComponentManager(QObject):
         self.components: Dict[str, QWidget] = {}
         self.layouts: Dict[str, Any] = {}
         
+        # Agent type -> function selector index, rebuilt by populate_function_selector
+        self._agent_type_index: Dict[str, int] = {}
+        
         # Main layout
         self.main_layout: Optional[QVBoxLayout] = None
         
@@ -44,6 +243,9 @@ class UIComponentManager(QObject):
             self.main_layout.setContentsMargins(12, 8, 12, 8)
             self.main_layout.setSpacing(6)
             
+            # Component styles are parsed once for the whole window
+            self.parent_widget.setStyleSheet(COMPONENT_STYLESHEET)
+            
             self.layouts["main"] = self.main_layout
             self.layout_updated.emit("main")
             
@@ -92,13 +294,7 @@ class UIComponentManager(QObject):
         """Create the AI assistant icon label."""
         ai_icon_label = QLabel()
         ai_icon_label.setFixedSize(32, 32)
-        ai_icon_label.setStyleSheet("""
-            QLabel {
-                background-color: rgba(59, 130, 246, 0.8);
-                border-radius: 16px;
-                border: 2px solid rgba(255, 255, 255, 0.2);
-            }
-        """)
+        ai_icon_label.setObjectName("aiIcon")
         ai_icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         ai_icon_label.setText("AI")
         
@@ -111,54 +307,7 @@ class UIComponentManager(QObject):
         function_selector = QComboBox()
         function_selector.setFixedSize(32, 32)
         
-        # Apply styling
-        function_selector.setStyleSheet("""
-            QComboBox {
-                background-color: rgba(75, 85, 99, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 16px;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0px;
-                text-align: center;
-            }
-            QComboBox:hover {
-                background-color: rgba(75, 85, 99, 0.8);
-            }
-            QComboBox:focus {
-                background-color: rgba(59, 130, 246, 0.8);
-                border: 1px solid rgba(59, 130, 246, 1.0);
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 12px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 3px solid transparent;
-                border-right: 3px solid transparent;
-                border-top: 3px solid white;
-                margin-right: 4px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: rgba(75, 85, 99, 0.95);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 8px;
-                color: white;
-                selection-background-color: rgba(59, 130, 246, 0.8);
-                padding: 4px;
-                min-width: 180px;
-            }
-            QComboBox QAbstractItemView::item {
-                padding: 6px 12px;
-                border-radius: 4px;
-                margin: 1px;
-            }
-            QComboBox QAbstractItemView::item:hover {
-                background-color: rgba(59, 130, 246, 0.6);
-            }
-        """)
+        function_selector.setObjectName("functionSelector")
         
         self.components["function_selector"] = function_selector
         self.component_created.emit("function_selector", function_selector)
@@ -168,22 +317,7 @@ class UIComponentManager(QObject):
         """Create the clear button (X)."""
         clear_button = QPushButton()
         clear_button.setFixedSize(32, 32)
-        clear_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(239, 68, 68, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 16px;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(239, 68, 68, 0.8);
-            }
-            QPushButton:pressed {
-                background-color: rgba(239, 68, 68, 1.0);
-            }
-        """)
+        clear_button.setObjectName("clearButton")
         clear_button.setText("×")
         clear_button.setToolTip("Clear content and return to initial state")
         clear_button.hide()  # Initially hidden
@@ -196,18 +330,7 @@ class UIComponentManager(QObject):
         """Create the voice input button."""
         voice_button = QPushButton()
         voice_button.setFixedSize(32, 32)
-        voice_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(75, 85, 99, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 16px;
-                color: white;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: rgba(75, 85, 99, 0.8);
-            }
-        """)
+        voice_button.setObjectName("voiceButton")
         voice_button.setText("🎤")
         voice_button.setToolTip("点击开始语音输入")
         voice_button.setEnabled(True)
@@ -222,22 +345,7 @@ class UIComponentManager(QObject):
             input_text = QTextEdit()
             input_text.setPlaceholderText("点击输入需要翻译的内容")
             input_text.setFixedHeight(56)  # 增加高度从48到56
-            input_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: rgba(31, 41, 55, 0.9);
-                    border: 2px solid rgba(59, 130, 246, 0.3);
-                    border-radius: 16px;
-                    padding: 8px 16px;
-                    color: white;
-                    font-size: 14px;
-                    line-height: 1.4;
-                    selection-background-color: rgba(59, 130, 246, 0.3);
-                }
-                QTextEdit:focus {
-                    border-color: rgba(59, 130, 246, 0.6);
-                    background-color: rgba(31, 41, 55, 1.0);
-                }
-            """)
+            input_text.setObjectName("inputText")
             
             self.components["input_text"] = input_text
             self.component_created.emit("input_text", input_text)
@@ -255,9 +363,7 @@ class UIComponentManager(QObject):
             # Result separator
             result_separator = QFrame()
             result_separator.setFrameShape(QFrame.Shape.HLine)
-            result_separator.setStyleSheet("""
-                QFrame { border: 1px solid rgba(255,255,255,0.06); margin-top: 4px; margin-bottom: 4px; }
-            """)
+            result_separator.setObjectName("resultSeparator")
             result_separator.hide()
             
             # Result container
@@ -285,21 +391,7 @@ class UIComponentManager(QObject):
             
             result_container_layout.addWidget(inner_container)
             
-            # Style the container
-            result_container.setStyleSheet("""
-                QWidget {
-                    background-color: rgba(31, 41, 55, 0.8);
-                    border: 1px solid rgba(75, 85, 99, 0.3);
-                    border-radius: 8px;
-                }
-                QLabel {
-                    background-color: transparent;
-                    border: none;
-                    color: white;
-                    font-size: 14px;
-                    selection-background-color: rgba(59, 130, 246, 0.35);
-                }
-            """)
+            result_container.setObjectName("resultContainer")
             result_container.hide()  # Initially hidden
             
             self.components["result_separator"] = result_separator
@@ -334,22 +426,7 @@ class UIComponentManager(QObject):
         upload_button = QPushButton("↑")
         upload_button.setFixedSize(32, 32)
         upload_button.setToolTip("Upload result (same as Enter key)")
-        upload_button.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(59, 130, 246, 0.8);
-                border: 1px solid rgba(59, 130, 246, 1.0);
-                border-radius: 16px;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(59, 130, 246, 1.0);
-            }
-            QPushButton:pressed {
-                background-color: rgba(37, 99, 235, 1.0);
-            }
-        """)
+        upload_button.setObjectName("uploadButton")
         upload_button.hide()  # Initially hidden
         
         self.components["upload_button"] = upload_button
@@ -380,11 +457,20 @@ class UIComponentManager(QObject):
             logger.error(f"Failed to create hidden controls: {e}")
             raise
     
+    def hidden_controls(self) -> tuple[QLabel, QPushButton]:
+        """Return the hidden status/process controls, creating them on first access."""
+        status_label = self.components.get("status_label")
+        process_button = self.components.get("process_button")
+        if status_label is None or process_button is None:
+            return self.create_hidden_controls()
+        return status_label, process_button
+    
     def populate_function_selector(self, function_selector: QComboBox, ai_service_manager, fallback_functions: Optional[Dict[str, str]] = None):
         """Populate function selector with available agents."""
         try:
             # Clear existing items
             function_selector.clear()
+            self._agent_type_index.clear()
             
             # Get available agents from AI Service Manager
             if ai_service_manager:
@@ -423,6 +509,7 @@ class UIComponentManager(QObject):
                             display_text = f"{icon} {display_name}"
                             
                             function_selector.addItem(display_text, agent_key)
+                            self._agent_type_index.setdefault(agent_key, function_selector.count() - 1)
                         
                         logger.info(f"Populated function selector with {len(available_agents)} agents")
                         return
@@ -435,6 +522,7 @@ class UIComponentManager(QObject):
                 # Add fallback functions to selector
                 for func_key, func_display in fallback_functions.items():
                     function_selector.addItem(func_display, func_key)
+                    self._agent_type_index.setdefault(func_key, function_selector.count() - 1)
                 
                 logger.info(f"Using fallback functions for function selector ({len(fallback_functions)} agents)")
             else:
@@ -443,6 +531,10 @@ class UIComponentManager(QObject):
         except Exception as e:
             logger.error(f"Error populating function selector: {e}")
     
+    def function_selector_index_for(self, agent_type: str) -> Optional[int]:
+        """Get the function selector index holding agent_type, or None."""
+        return self._agent_type_index.get(agent_type)
+    
     def apply_theme_styling(self, theme_config: Dict[str, Any]):
         """Apply theme-based styling to components."""
         try:
@@ -452,74 +544,13 @@ class UIComponentManager(QObject):
             border_color = theme_config.get('border_color', 'rgba(255, 255, 255, 0.3)')
             cursor_color = theme_config.get('cursor_color', '#3B82F6')
             
-            # Apply window style
-            window_style = f"""
-            QWidget {{
-                background-color: {bg_color};
-                border-radius: 12px;
-                color: {text_color};
-            }}
-            """
-            
-            # Input text style
-            input_style = f"""
-            QTextEdit {{
-                background-color: rgba(0, 0, 0, 0.3);
-                border: 1px solid {border_color};
-                border-radius: 8px;
-                padding: 8px;
-                color: {text_color};
-                selection-background-color: rgba(255, 255, 255, 0.3);
-            }}
-            QTextEdit:focus {{
-                border: 2px solid {cursor_color};
-            }}
-            """
-            
-            # Result label style
-            result_style = f"""
-            QLabel {{
-                background-color: rgba(0, 0, 0, 0.2);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 6px;
-                padding: 8px;
-                color: {text_color};
-            }}
-            """
-            
-            # Button style
-            button_style = f"""
-            QPushButton {{
-                background-color: rgba(0, 0, 0, 0.4);
-                border: 1px solid {border_color};
-                border-radius: 6px;
-                padding: 6px 12px;
-                color: {text_color};
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255, 255, 255, 0.1);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(255, 255, 255, 0.2);
-            }}
-            QPushButton:disabled {{
-                background-color: rgba(0, 0, 0, 0.2);
-                color: rgba(255, 255, 255, 0.5);
-            }}
-            """
-            
-            # Status label style
-            status_style = f"""
-            QLabel {{
-                color: {text_color};
-                font-size: 12px;
-                padding: 4px;
-            }}
-            """
+            window_style, input_style, result_style, button_style, status_style = (
+                _build_theme_qss(bg_color, text_color, border_color, cursor_color)
+            )
             
             # Apply styles to components
             if self.parent_widget:
-                self.parent_widget.setStyleSheet(window_style)
+                self.parent_widget.setStyleSheet(window_style + COMPONENT_STYLESHEET)
             
             if "input_text" in self.components:
                 self.components["input_text"].setStyleSheet(input_style)
@@ -25,7 +25,7 @@ class WindowManager(QObject):
     state_changed = Signal(object)  # WindowState
     
     def __init__(self, window: QWidget, config_manager):
-        super().__init__()
+        super().__init__(window)
         self.window = window
         self.config_manager = config_manager
         self.logger = get_logger(__name__)
@@ -90,6 +90,11 @@ class WindowManager(QObject):
         except Exception as e:
             self.logger.error(f" Failed to show window: {e}")
     
+    def bring_to_front(self):
+        """Raise and activate an already visible window."""
+        self.window.raise_()
+        self.window.activateWindow()
+    
     def hide_window(self):
         """Hide the window."""
         try:
@@ -53,7 +53,8 @@ logger.add(
     retention="30 days",
     compression="zip",
     backtrace=True,
-    diagnose=True
+    diagnose=True,
+    enqueue=True  # Write from loguru's worker thread, not the caller (UI) thread
 )
 
 # Configure error file handler
@@ -65,7 +66,8 @@ logger.add(
     retention="30 days",
     compression="zip",
     backtrace=True,
-    diagnose=True
+    diagnose=True,
+    enqueue=True  # Write from loguru's worker thread, not the caller (UI) thread
 )
 
 def get_logger(name: str = None):
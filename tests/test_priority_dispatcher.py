@@ -0,0 +1,81 @@
+"""
+Tests for the floating window's worker-to-GUI priority dispatcher.
+"""
+
+import threading
+import time
+
+import pytest
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+# The floating window package pulls in Windows-only integrations on import
+processing = pytest.importorskip(
+    "src.ui.windows.floating_window.processing", exc_type=ImportError
+)
+async_processor = pytest.importorskip(
+    "src.ui.widgets.async_processor", exc_type=ImportError
+)
+
+
+@pytest.fixture
+def qt_app():
+    """Return the running QCoreApplication, creating one if needed."""
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def _wait_for(app, predicate, timeout=5.0):
+    """Pump the Qt event queue until predicate() holds or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return predicate()
+
+
+class _EchoService:
+    """AI service stand-in that upper-cases the input text."""
+
+    def process_text(self, text, agent_name, window_context=None):
+        return text.upper()
+
+
+def test_post_from_worker_thread_runs_on_gui_thread(qt_app):
+    dispatcher = processing._PriorityDispatcher()
+    calls = []
+
+    def handler(*args):
+        calls.append((args, threading.current_thread() is threading.main_thread()))
+
+    worker = threading.Thread(target=dispatcher.post, args=(handler, 7, "agent"))
+    worker.start()
+    worker.join()
+
+    assert _wait_for(qt_app, lambda: calls)
+    assert calls == [((7, "agent"), True)]
+
+
+def test_request_result_reaches_handler_through_dispatcher(qt_app):
+    dispatcher = processing._PriorityDispatcher()
+    processor = async_processor.AsyncProcessor(_EchoService())
+    started, completed = [], []
+
+    # Same wiring as ProcessingModule.setup_buffers_and_processors
+    for signal, handler in (
+        (processor.processing_started, lambda *args: started.append(args)),
+        (processor.processing_completed, lambda *args: completed.append(args)),
+    ):
+        signal.connect(
+            lambda *args, handler=handler: dispatcher.post(handler, *args),
+            QtCore.Qt.DirectConnection,
+        )
+
+    processor.start()
+    try:
+        request_id = processor.submit_request("hello", "translator")
+        assert _wait_for(qt_app, lambda: completed)
+    finally:
+        processor.stop_processing()
+        processor.wait(2000)
+
+    assert started == [(request_id, "translator")]
+    assert completed == [(request_id, "translator", "HELLO")]